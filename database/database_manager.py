@@ -83,6 +83,13 @@ class DatabaseManager:
                 )
             """)
 
+            # Databases also used by TTBWDatabase record history with triggers on current_players
+            cursor.execute("""
+                SELECT 1 FROM sqlite_master
+                WHERE type = 'trigger' AND tbl_name = 'current_players' AND sql LIKE '%player_history%'
+            """)
+            self.history_recorded_by_triggers = cursor.fetchone() is not None
+
             conn.commit()
             logger.info("Database initialized successfully")
     
@@ -18,6 +18,8 @@ class PlayerManager:
     def __init__(self, database_manager):
         self.db_manager = database_manager
         self.config = database_manager.config
+        # Checked once when the database is opened, not on every write
+        self.history_recorded_by_triggers = database_manager.history_recorded_by_triggers
     
     def load_players_from_csv(self, csv_file: str) -> int:
         """
@@ -146,9 +148,11 @@ class PlayerManager:
         with sqlite3.connect(self.db_manager.db_path) as conn:
             cursor = conn.cursor()
 
-            # Check if player exists
+            # Check if player exists (only the columns compared and recorded below)
             cursor.execute("""
-                SELECT * FROM current_players WHERE interne_lizenznr = ?
+                SELECT first_name, last_name, club, gender, district, birth_year,
+                       age_class, region, qttr, club_number, verband
+                FROM current_players WHERE interne_lizenznr = ?
             """, (player_record.interne_lizenznr,))
 
             existing_player = cursor.fetchone()
@@ -198,24 +202,21 @@ class PlayerManager:
     
     def _has_changes(self, existing_player: Tuple, new_record: PlayerRecord) -> bool:
         """Check if there are changes between existing and new player record."""
-        # existing_player is a tuple from database query
-        # Compare relevant fields (excluding timestamps and auto-increment fields)
-        return (
-                existing_player[1] != new_record.first_name or  # first_name
-                existing_player[2] != new_record.last_name or  # last_name
-                existing_player[3] != new_record.club or  # club
-                existing_player[4] != new_record.gender or  # gender
-                existing_player[5] != new_record.district or  # district
-                existing_player[6] != new_record.birth_year or  # birth_year
-                existing_player[7] != new_record.age_class or  # age_class
-                existing_player[8] != new_record.region or  # region
-                existing_player[9] != new_record.qttr or  # qttr
-                existing_player[10] != new_record.club_number  # club_number
+        # existing_player starts with first_name .. club_number (see _update_player_in_database)
+        return existing_player[:10] != (
+            new_record.first_name, new_record.last_name, new_record.club,
+            new_record.gender, new_record.district, new_record.birth_year,
+            new_record.age_class, new_record.region, new_record.qttr,
+            new_record.club_number
         )
     
     def _record_change(self, cursor: sqlite3.Cursor, old_record: Optional[Tuple], new_record: PlayerRecord, change_type: str) -> None:
         """Record a change in the player_history table."""
         try:
+            # The database's own triggers already recorded this change
+            if self.history_recorded_by_triggers:
+                return
+
             # Check if this exact change is already recorded
             if change_type == 'UPDATE' and old_record:
                 cursor.execute("""
@@ -223,7 +224,7 @@ class PlayerManager:
                     WHERE interne_lizenznr = ? AND change_type = 'UPDATE' 
                     AND previous_club = ? AND club = ?
                     AND changed_at > datetime('now', '-1 minute')
-                """, (new_record.interne_lizenznr, old_record[3], new_record.club))
+                """, (new_record.interne_lizenznr, old_record[2], new_record.club))
                 
                 if cursor.fetchone()[0] > 0:
                     logger.debug(f"Skipping duplicate change record for {new_record.first_name} {new_record.last_name}")
@@ -242,8 +243,8 @@ class PlayerManager:
                 new_record.birth_year, new_record.age_class, new_record.region,
                 new_record.qttr, new_record.club_number, new_record.verband,
                 change_type,
-                old_record[3] if old_record else None,  # previous_club
-                old_record[5] if old_record else None   # previous_district
+                old_record[2] if old_record else None,  # previous_club
+                old_record[4] if old_record else None   # previous_district
             ))
             
         except Exception as e:
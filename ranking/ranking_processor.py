@@ -11,6 +11,7 @@ from models.player import Player
 from models.tournament import TournamentConfig
 from database.database_manager import DatabaseManager
 from database.player_manager import PlayerManager
+from utils.text_utils import replace_umlauts as _replace_umlauts_text
 
 logger = logging.getLogger(__name__)
 
@@ -262,13 +263,7 @@ class RankingProcessor:
     
     def _replace_umlauts(self, text: str) -> str:
         """Replace German umlauts with their ASCII equivalents."""
-        replacements = {
-            'ö': 'oe', 'ä': 'ae', 'ü': 'ue', 'ß': 'ss',
-            'Ö': 'Oe', 'Ä': 'Ae', 'Ü': 'Ue'
-        }
-        for umlaut, replacement in replacements.items():
-            text = text.replace(umlaut, replacement)
-        return text
+        return _replace_umlauts_text(text)
     
     def _update_player_results(self, player_id: str, tournament_name: str, competition_name: str, position: int) -> None:
         """Update player results and points."""
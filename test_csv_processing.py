@@ -165,7 +165,18 @@ class TestCSVProcessing(unittest.TestCase):
         self.assertEqual(player.birth_year, 2010)
         self.assertEqual(player.age_class, 15)
         self.assertEqual(player.region, 1)
-    
+
+    def test_bulk_load_rebuilds_indexes(self):
+        """Test bulk loading from CSV keeps the secondary indexes in place."""
+        players_loaded = self.db.bulk_load(self.test_csv_path)
+        self.assertEqual(players_loaded, 5)
+        self.assertEqual(len(self.db.get_all_current_players()), 5)
+
+        with sqlite3.connect(self.test_db_path) as conn:
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        for name, _ in TTBWDatabase._SECONDARY_INDEXES:
+            self.assertIn(name, indexes)
+
     def test_csv_loading_skips_invalid_rows(self):
         """Test that invalid CSV rows are properly skipped."""
         # Create CSV with invalid data
@@ -341,6 +352,45 @@ class TestCSVProcessing(unittest.TestCase):
         self.assertIsNotNone(player2)
         self.assertEqual(player1.birth_year, 2010)
         self.assertEqual(player2.birth_year, 2011)
+    
+    def test_birth_date_parsing_edge_cases(self):
+        """Test that bulk and row ingest parse the same birth dates the same way."""
+        birth_dates = {
+            '03.03.2013 ': 2013,  # Surrounding whitespace is ignored
+            ' 2011': 2011,
+            '3.3.2012': 2012,
+            '12345': None,        # Not a four-digit year
+            'ID2010': None,
+            '03.03.13': None,
+        }
+        
+        rows = [{
+            'Verband': 'TTBW',
+            'Region': 'Ulm',
+            'VereinName': 'Test Club',
+            'VereinNr': '88888',
+            'Anrede': 'Herr',
+            'Nachname': f'Date{i}',
+            'Vorname': 'Edge',
+            'Geburtsdatum': birth_date,
+            'InterneNr': f'EDGE{i:03d}'
+        } for i, birth_date in enumerate(birth_dates)]
+        
+        edge_csv_path = os.path.join(self.test_dir, "edge_dates.csv")
+        with open(edge_csv_path, 'w', newline='', encoding='latin1') as f:
+            writer = csv.DictWriter(f, fieldnames=rows[0].keys(), delimiter=';')
+            writer.writeheader()
+            writer.writerows(rows)
+        
+        players_loaded = self.db.load_players_from_csv(edge_csv_path)
+        self.assertEqual(players_loaded, sum(year is not None for year in birth_dates.values()))
+        
+        for row, expected in zip(rows, birth_dates.values()):
+            player = self.db.get_player_by_lizenznr(row['InterneNr'])
+            self.assertEqual(player.birth_year if player else None, expected)
+            # The row path agrees with the bulk path
+            record = self.db._build_player_record(row)
+            self.assertEqual(record.birth_year if record else None, expected)
 
 
 class TestReportGeneration(unittest.TestCase):
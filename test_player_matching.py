@@ -19,6 +19,8 @@ import yaml
 from unittest.mock import patch, MagicMock
 
 from ttbw_database import TTBWDatabase, PlayerRecord
+from utils.edit_distance import bounded_levenshtein
+from utils.text_utils import TextUtils
 
 
 class TestPlayerMatching(unittest.TestCase):
@@ -324,7 +326,65 @@ class TestPlayerMatching(unittest.TestCase):
         # Try to find by new club name
         found_id = self.db.find_player_by_name_and_club('John', 'Smith', 'Updated Club')
         self.assertEqual(found_id, 'STD001')
-    
+
+    def test_bulk_lookup_matches_single_lookup(self):
+        """Test that the batched lookup returns the same players as single lookups."""
+        updated_player = PlayerRecord(
+            interne_lizenznr='STD001',
+            first_name='John',
+            last_name='Smith',
+            club='Updated Club',
+            gender='Jungen',
+            district='Hochschwarzwald',
+            birth_year=2010,
+            age_class=15,
+            region=1
+        )
+        self.db._update_player_in_database(updated_player)
+
+        keys = [
+            ('John', 'Smith', 'Standard Club', ''),
+            ('John', 'Smith', 'Updated Club', ''),
+            ('Unknown', 'Player', 'Nowhere', ''),
+        ]
+        results = self.db.find_players_bulk(keys)
+
+        self.assertEqual(set(results), set(keys))
+        for first_name, last_name, club, club_number in keys:
+            expected = self.db.find_player_by_name_and_club(first_name, last_name, club, club_number)
+            self.assertEqual(results[(first_name, last_name, club, club_number)], expected)
+        self.assertIsNone(results[('Unknown', 'Player', 'Nowhere', '')])
+
+    def test_variants_skip_original_name(self):
+        """Test that variant matching skips the original name in Python's lowercase."""
+        for lizenznr, first_name, last_name, club in [
+            ('LOEWE001', 'Luis', 'LÖWE', 'SV B'),
+            ('LOEWE002', 'Louis', 'Löwe', 'TTC Ä'),
+        ]:
+            self.db._update_player_in_database(PlayerRecord(
+                interne_lizenznr=lizenznr,
+                first_name=first_name,
+                last_name=last_name,
+                club=club,
+                gender='Jungen',
+                district='Ulm',
+                birth_year=2010,
+                age_class=15,
+                region=2
+            ))
+        
+        # 'LÖWE' lowercases to 'löwe' here but to 'lÖwe' in SQL; 'löwe' counts as the
+        # original name, so the match comes from the first name variant 'Luis'
+        self.assertEqual(self.db.find_player_by_name_and_club('Louis', 'LÖWE', 'TTC Ä'), 'LOEWE001')
+
+    def test_lookup_key_matches_sql_normalization(self):
+        """Test that the in-memory lookup key follows SQLite's LOWER(TRIM(...))."""
+        conn = self.db._get_connection()
+        for value in ('  John ', 'SMITH', 'Jörg', 'JÖRG', 'Straße', '\tTab\n', 'Club\u3000', ''):
+            expected = conn.execute("SELECT LOWER(TRIM(?))", (value,)).fetchone()[0]
+            self.assertEqual(TTBWDatabase._lookup_key(value), expected)
+        self.assertIsNone(TTBWDatabase._lookup_key(None))
+
     def test_fuzzy_match_logging(self):
         """Test that fuzzy matches are properly logged."""
         # Clear existing fuzzy matches
@@ -530,6 +590,83 @@ class TestNameVariants(unittest.TestCase):
         found_id = self.db.find_player_by_name_and_club('Mark', 'Miller', 'Variant Club')
         self.assertEqual(found_id, 'VAR001')
 
+    def test_typo_matching(self):
+        """Test the last-resort edit distance match within the same club."""
+        typo_player = PlayerRecord(
+            interne_lizenznr='TYPO001',
+            first_name='Jonas',
+            last_name='Schneider',
+            club='Typo Club',
+            gender='Jungen',
+            district='Test_District',
+            birth_year=2010,
+            age_class=15,
+            region=1
+        )
+        self.db._update_player_in_database(typo_player)
+
+        # One typo in the last name is tolerated
+        found_id = self.db.find_player_by_name_and_club('Jonas', 'Schnieder', 'Typo Club')
+        self.assertIsNone(found_id)  # Transposition counts as two edits
+        found_id = self.db.find_player_by_name_and_club('Jonas', 'Schneidr', 'Typo Club')
+        self.assertEqual(found_id, 'TYPO001')
+
+        # Not in another club, and not with more than one edit
+        found_id = self.db.find_player_by_name_and_club('Jonas', 'Schneidr', 'Other Club')
+        self.assertIsNone(found_id)
+        found_id = self.db.find_player_by_name_and_club('Jona', 'Schneidr', 'Typo Club')
+        self.assertIsNone(found_id)
+
+
+class TestEditDistance(unittest.TestCase):
+    """Test cases for the bounded edit distance."""
+
+    def test_bounded_levenshtein(self):
+        """Test distances within and beyond the tolerance."""
+        self.assertEqual(bounded_levenshtein('schneider', 'schneider', 1), 0)
+        self.assertEqual(bounded_levenshtein('schneider', 'schneidr', 1), 1)
+        self.assertEqual(bounded_levenshtein('meier', 'meyer', 1), 1)
+        self.assertEqual(bounded_levenshtein('kitten', 'sitting', 3), 3)
+        self.assertIsNone(bounded_levenshtein('kitten', 'sitting', 2))
+        self.assertIsNone(bounded_levenshtein('schneider', 'schnieder', 1))
+
+    def test_bounded_levenshtein_edge_cases(self):
+        """Test empty, long and non-ASCII strings."""
+        self.assertEqual(bounded_levenshtein('', '', 0), 0)
+        self.assertEqual(bounded_levenshtein('', 'a', 1), 1)
+        self.assertIsNone(bounded_levenshtein('', 'ab', 1))
+        self.assertEqual(bounded_levenshtein('löwe', 'lowe', 1), 1)
+        self.assertEqual(bounded_levenshtein('a' * 100, 'a' * 99 + 'b', 1), 1)
+
+
+class TestTextUtils(unittest.TestCase):
+    """Test cases for name normalization."""
+
+    def test_normalize_name(self):
+        """Test case folding, umlauts, whitespace and non-string input."""
+        self.assertEqual(TextUtils.normalize_name('  Müller '), 'mueller')
+        self.assertEqual(TextUtils.normalize_name('GRÖSSE'), 'groesse')
+        self.assertEqual(TextUtils.normalize_name('Weiß'), 'weiss')
+        self.assertEqual(TextUtils.normalize_name('STRAẞE'), 'strasse')
+        self.assertEqual(TextUtils.normalize_club('TTC Ärger'), 'ttc aerger')
+        for value in ('', '   ', None, float('nan'), 5):
+            self.assertEqual(TextUtils.normalize_name(value), '')
+
+    def test_normalize_name_is_interned(self):
+        """Test that spellings which normalize alike return the same string object."""
+        self.assertIs(TextUtils.normalize_name(' Jürgen'), TextUtils.normalize_name('JÜRGEN '))
+        self.assertIs(TextUtils.normalize_name(''.join(['Sch', 'mid'])), TextUtils.normalize_name('schmid'))
+
+    def test_normalize_name_series(self):
+        """Test that whole columns follow the same rules as normalize_name."""
+        values = ['  Müller ', 'GRÖSSE', 'Weiß', 'Ärger', 'Hans', '', None, float('nan'), 5]
+        expected = [TextUtils.normalize_name(value) for value in values]
+        self.assertEqual(TextUtils.normalize_name_series(pd.Series(values)).tolist(), expected)
+        self.assertEqual(TextUtils.normalize_name_series(pd.Series([1, 2], index=[3, 4])).to_dict(),
+                         {3: '', 4: ''})
+        self.assertEqual(TextUtils.normalize_name_series(pd.Series(['Öl', 'x'], dtype='str')).tolist(),
+                         ['oel', 'x'])
+
 
 if __name__ == '__main__':
     # Create test suite
@@ -538,6 +675,8 @@ if __name__ == '__main__':
     # Add test classes
     test_suite.addTest(unittest.makeSuite(TestPlayerMatching))
     test_suite.addTest(unittest.makeSuite(TestNameVariants))
+    test_suite.addTest(unittest.makeSuite(TestEditDistance))
+    test_suite.addTest(unittest.makeSuite(TestTextUtils))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
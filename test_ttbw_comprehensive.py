@@ -18,6 +18,7 @@ import sqlite3
 import pandas as pd
 import yaml
 from unittest.mock import patch, MagicMock, mock_open
+from dataclasses import replace
 from datetime import datetime
 
 # Import the modules to test
@@ -418,6 +419,62 @@ class TestTTBWDatabase(unittest.TestCase):
             self.assertEqual(duplicates_removed, 0)
 
 
+    def test_reopen_keeps_duplicate_history(self):
+        """Test that opening a database with duplicate history does not delete rows."""
+        self.db.close()
+        with sqlite3.connect(self.test_db_path) as conn:
+            conn.execute("DROP INDEX idx_unique_history")
+            for _ in range(2):
+                conn.execute("""
+                    INSERT INTO player_history (
+                        interne_lizenznr, first_name, last_name, club, gender, district,
+                        birth_year, age_class, region, verband, change_type
+                    ) VALUES ('DUPE456', 'Old', 'Duplicate', 'Old Club', 'Jungen',
+                              'Ulm', 2010, 15, 2, 'TTBW', 'INSERT')
+                """)
+        
+        # Only an explicit cleanup_duplicate_history() may remove them
+        TTBWDatabase(self.test_db_path, self.test_config_path).close()
+        
+        with sqlite3.connect(self.test_db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM player_history WHERE interne_lizenznr = 'DUPE456'")
+            self.assertEqual(cursor.fetchone()[0], 2)
+
+
+    def test_player_manager_on_triggered_database(self):
+        """Test that PlayerManager leaves history to the triggers of a TTBWDatabase file."""
+        from database import DatabaseManager, PlayerManager
+        
+        player_manager = PlayerManager(DatabaseManager(self.test_db_path, self.test_config_path))
+        player = PlayerRecord(
+            interne_lizenznr='PM123',
+            first_name='Manager',
+            last_name='Player',
+            club='First Club',
+            gender='Jungen',
+            district='Ulm',
+            birth_year=2010,
+            age_class=15,
+            region=2
+        )
+        moved = replace(player, club='Second Club')
+        
+        with patch('database.player_manager.logger') as mock_logger:
+            player_manager._update_player_in_database(player)
+            player_manager._update_player_in_database(moved)
+        mock_logger.error.assert_not_called()
+        
+        with sqlite3.connect(self.test_db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT change_type, club, previous_club FROM player_history
+                WHERE interne_lizenznr = 'PM123' ORDER BY id
+            """)
+            self.assertEqual(cursor.fetchall(), [('INSERT', 'First Club', None),
+                                                 ('UPDATE', 'Second Club', 'First Club')])
+
+
 class TestRankingProcessor(unittest.TestCase):
     """Test cases for RankingProcessor class."""
     
@@ -6,6 +6,7 @@ This script processes table tennis tournament data from various sources and gene
 regional ranking reports. It handles players, tournament results, and QTTR ratings.
 """
 
+import functools
 import os
 import re
 import csv
@@ -18,12 +19,19 @@ from collections import defaultdict
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from ttbw_database import TTBWDatabase, PlayerRecord
+from utils.text_utils import replace_umlauts as _replace_umlauts_text
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=65536)
+def _squash_lower(text: str) -> str:
+    """Lowercase text and remove all whitespace; cached since player names repeat across lookups."""
+    return ''.join(text.lower().split())
+
+
 @dataclass
 class TournamentConfig:
     """Configuration for a tournament including ID and point values."""
@@ -120,13 +128,7 @@ class RankingProcessor:
     @staticmethod
     def replace_umlauts(text: str) -> str:
         """Replace German umlauts with their ASCII equivalents."""
-        replacements = {
-            'ö': 'oe', 'ä': 'ae', 'ü': 'ue', 'ß': 'ss',
-            'Ö': 'Oe', 'Ä': 'Ae', 'Ü': 'Ue'
-        }
-        for umlaut, replacement in replacements.items():
-            text = text.replace(umlaut, replacement)
-        return text
+        return _replace_umlauts_text(text)
 
     def load_qttr_ratings(self) -> None:
         """Load QTTR ratings from files starting with 'QTTR_'."""
@@ -379,13 +381,27 @@ class RankingProcessor:
         matches_found = 0
         players_matched = 0
 
-        for match in re.finditer(pattern, content, re.DOTALL):
-            position, last_name, first_name, club, club_number = match.groups()
+        results = [match.groups() for match in re.finditer(pattern, content, re.DOTALL)]
+
+        # Resolve XML participants first, then look up all remaining players in one batch
+        player_ids = {}
+        pending = []
+        for _, last_name, first_name, club, club_number in results:
+            key = (first_name, last_name, club, club_number)
+            if key not in player_ids:
+                player_ids[key] = self._find_participant_id(first_name, last_name, club_number)
+                if player_ids[key] is None:
+                    pending.append(key)
+        if pending:
+            for key, player_id in self.db.find_players_bulk(pending).items():
+                player_ids[key] = player_id or self._find_player_in_memory(*key)
+
+        for position, last_name, first_name, club, club_number in results:
             position = int(position)
             matches_found += 1
 
-            # Try to find the player by matching name and club
-            player_id = self._find_player_by_name_and_club(first_name, last_name, club, club_number)
+            # Player matched by name and club above
+            player_id = player_ids[(first_name, last_name, club, club_number)]
 
             if player_id:
                 players_matched += 1
@@ -407,45 +423,42 @@ class RankingProcessor:
         if matches_found > 0:
             print(f"Competition {competition_name}: Found {matches_found} results, matched {players_matched} players")
 
-    def _find_player_by_name_and_club(self, first_name: str, last_name: str, club: str, club_number: str) -> Optional[
-        str]:
-        """Find a player by matching name and club information using database."""
-        # First try to find by exact match using the XML participants if available
+    def _find_participant_id(self, first_name: str, last_name: str, club_number: str) -> Optional[str]:
+        """Find a player among the XML participants of the tournaments."""
+        name_club_id = self.replace_umlauts(f"{first_name}{last_name}{club_number}")
         for tournament_name, tournament in self.tournaments.items():
             if hasattr(tournament, 'participants'):
-                name_club_id = self.replace_umlauts(f"{first_name}{last_name}{club_number}")
                 if name_club_id in tournament.participants:
                     return tournament.participants[name_club_id]
+        return None
 
-        # Use database for better matching (includes historical club changes)
-        player_id = self.db.find_player_by_name_and_club(first_name, last_name, club, club_number)
-        if player_id:
-            return player_id
+    def _find_player_in_memory(self, first_name: str, last_name: str, club: str, club_number: str) -> Optional[str]:
+        """Find a player among the loaded players by normalized name and club."""
+        first_key, last_key = self._normalize_name(first_name), self._normalize_name(last_name)
+        club_key = self._normalize_club(club)
 
-        # Fallback to in-memory matching if database didn't find anything
         for player_id, player in self.players.items():
+            if (self._normalize_name(player.first_name) != first_key or
+                    self._normalize_name(player.last_name) != last_key):
+                continue
+
             # Try different matching strategies
-            if (self._normalize_name(player.first_name) == self._normalize_name(first_name) and
-                    self._normalize_name(player.last_name) == self._normalize_name(last_name) and
-                    self._normalize_club(player.club) == self._normalize_club(club)):
+            if self._normalize_club(player.club) == club_key:
                 return player_id
 
             # Also try matching with club number if available
-            if club_number and hasattr(player, 'club_number'):
-                if (self._normalize_name(player.first_name) == self._normalize_name(first_name) and
-                        self._normalize_name(player.last_name) == self._normalize_name(last_name) and
-                        str(player.club_number) == club_number):
-                    return player_id
+            if club_number and hasattr(player, 'club_number') and str(player.club_number) == club_number:
+                return player_id
 
         return None
 
     def _normalize_name(self, name: str) -> str:
         """Normalize a name for comparison by removing spaces and converting to lowercase."""
-        return re.sub(r'\s+', '', name.lower())
+        return _squash_lower(name)
 
     def _normalize_club(self, club: str) -> str:
         """Normalize a club name for comparison by removing spaces and converting to lowercase."""
-        return re.sub(r'\s+', '', club.lower())
+        return _squash_lower(club)
 
     def _update_player_results(self, player_id: str, tournament_name: str, competition_name: str,
                                position: int) -> None:
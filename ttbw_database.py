@@ -6,18 +6,27 @@ This module handles SQLite database operations for tracking player changes over
 It maintains current player records and historical changes for audit purposes.
 """
 
+import functools
 import sqlite3
+import string
+import numpy as np
 import pandas as pd
 import yaml
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+from utils.edit_distance import bounded_levenshtein
+from utils.name_utils import NameUtils
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ASCII-only lowercasing, as SQLite's LOWER() does without the ICU extension
+_SQL_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
 
 @dataclass
 class PlayerRecord:
@@ -41,9 +50,167 @@ class PlayerRecord:
 class TTBWDatabase:
     """SQLite database manager for TTBW player data."""
 
+    # Prepared statements kept per connection; the ingest and lookup paths reuse a few dozen
+    _STATEMENT_CACHE_SIZE = 256
+
+    # Applied once when the shared connection is opened
+    _CONNECTION_PRAGMAS = (
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA temp_store=MEMORY',
+        'PRAGMA cache_size=-65536',
+    )
+
+    # CSV rows read and flushed with executemany per chunk during ingest
+    _INGEST_BATCH_SIZE = 10_000
+
+    # Maximum edit distance (first and last name combined) for the last-resort typo match
+    _NAME_EDIT_TOLERANCE = 1
+
+    # Secondary indexes, dropped during bulk loads and rebuilt afterwards
+    _SECONDARY_INDEXES = (
+        ('idx_current_players_name', 'current_players(last_name_norm, first_name_norm, club_norm)'),
+        ('idx_current_players_club', 'current_players(club_norm)'),
+        ('idx_history_lizenznr', 'player_history(interne_lizenznr, changed_at DESC)'),
+        ('idx_history_name', 'player_history(last_name_norm, first_name_norm, club_norm, changed_at)'),
+    )
+
+    # Generated LOWER(TRIM(...)) columns on current_players and player_history,
+    # so lookups can use an index
+    _NORMALIZED_COLUMNS = (
+        ('first_name_norm', 'first_name'),
+        ('last_name_norm', 'last_name'),
+        ('club_norm', 'club'),
+    )
+
+    # Fields of a logged fuzzy match, in the order _log_fuzzy_match stores them
+    _FUZZY_COLS = (
+        'tournament_name', 'db_name', 'tournament_club', 'db_club', 'tournament_first',
+        'tournament_last', 'db_first', 'db_last', 'old_club', 'current_club',
+    )
+
+    # current_players columns in PlayerRecord field order
+    _PLAYER_RECORD_COLUMNS = """
+        interne_lizenznr, first_name, last_name, club, gender, district, birth_year,
+        age_class, region, qttr, club_number, verband, created_at, updated_at
+    """
+
+    # Inserts new players; existing ones are only rewritten when a tracked field differs
+    _SQL_UPSERT_PLAYER = """
+        INSERT INTO current_players (
+            interne_lizenznr, first_name, last_name, club, gender, district,
+            birth_year, age_class, region, qttr, club_number, verband
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(interne_lizenznr) DO UPDATE SET
+            first_name = excluded.first_name, last_name = excluded.last_name,
+            club = excluded.club, gender = excluded.gender, district = excluded.district,
+            birth_year = excluded.birth_year, age_class = excluded.age_class,
+            region = excluded.region, qttr = excluded.qttr, club_number = excluded.club_number,
+            verband = excluded.verband, updated_at = CURRENT_TIMESTAMP
+        WHERE current_players.first_name IS NOT excluded.first_name
+           OR current_players.last_name IS NOT excluded.last_name
+           OR current_players.club IS NOT excluded.club
+           OR current_players.gender IS NOT excluded.gender
+           OR current_players.district IS NOT excluded.district
+           OR current_players.birth_year IS NOT excluded.birth_year
+           OR current_players.age_class IS NOT excluded.age_class
+           OR current_players.region IS NOT excluded.region
+           OR current_players.qttr IS NOT excluded.qttr
+           OR current_players.club_number IS NOT excluded.club_number
+    """
+
+    # History trigger on current_players. The duplicate check is spelled out rather than
+    # using INSERT OR IGNORE because an upsert's conflict policy overrides the one in a trigger.
+    _SQL_CREATE_HISTORY_TRIGGER = """
+        CREATE TRIGGER IF NOT EXISTS {name}
+        AFTER {event} ON current_players
+        WHEN {when}
+        BEGIN
+            INSERT INTO player_history (
+                interne_lizenznr, first_name, last_name, club, gender, district,
+                birth_year, age_class, region, qttr, club_number, verband,
+                change_type, previous_club, previous_district
+            )
+            SELECT NEW.interne_lizenznr, NEW.first_name, NEW.last_name, NEW.club, NEW.gender,
+                   NEW.district, NEW.birth_year, NEW.age_class, NEW.region, NEW.qttr,
+                   NEW.club_number, NEW.verband, '{change_type}', {previous_club}, {previous_district}
+            WHERE NOT EXISTS (
+                SELECT 1 FROM player_history
+                WHERE interne_lizenznr = NEW.interne_lizenznr AND first_name = NEW.first_name
+                  AND last_name = NEW.last_name AND club = NEW.club AND gender = NEW.gender
+                  AND district = NEW.district AND birth_year = NEW.birth_year
+                  AND age_class = NEW.age_class AND region = NEW.region
+                  AND COALESCE(qttr, '') = COALESCE(NEW.qttr, '')
+                  AND COALESCE(club_number, '') = COALESCE(NEW.club_number, '')
+                  AND verband IS NEW.verband AND change_type = '{change_type}'
+                  AND COALESCE(previous_club, '') = COALESCE({previous_club}, '')
+                  AND COALESCE(previous_district, '') = COALESCE({previous_district}, '')
+            );
+        END
+    """
+
+    # Most recent eligible history row for an exact name and club
+    _SQL_HISTORY_MATCH = """
+        SELECT interne_lizenznr, first_name, last_name, club, birth_year, gender, district, age_class, region
+        FROM player_history
+        WHERE first_name_norm = LOWER(TRIM(?))
+        AND last_name_norm = LOWER(TRIM(?))
+        AND club_norm = LOWER(TRIM(?))
+        AND birth_year >= ?
+        ORDER BY changed_at DESC
+        LIMIT 1
+    """
+
+    # Eligible history rows for every key in the lookup_keys temp table, most recent first per key
+    _SQL_HISTORY_MATCH_BATCH = """
+        SELECT k.rowid, h.interne_lizenznr, h.first_name, h.last_name, h.club, h.birth_year,
+               h.gender, h.district, h.age_class, h.region
+        FROM lookup_keys k
+        JOIN player_history h
+          ON h.first_name_norm = LOWER(TRIM(k.first_name))
+         AND h.last_name_norm = LOWER(TRIM(k.last_name))
+         AND h.club_norm = LOWER(TRIM(k.club))
+        WHERE h.birth_year >= ?
+        ORDER BY k.rowid, h.changed_at DESC
+    """
+
+    # Eligible history rows for every variant in the lookup_variants temp table, most recent first per key
+    _SQL_HISTORY_VARIANTS_BATCH = """
+        SELECT v.key_id, h.first_name_norm, h.interne_lizenznr, h.first_name, h.last_name, h.club,
+               h.birth_year, h.gender, h.district, h.age_class, h.region
+        FROM lookup_variants v
+        JOIN player_history h
+          ON h.first_name_norm = v.first_name
+         AND h.last_name_norm = LOWER(TRIM(v.last_name))
+         AND h.club_norm = LOWER(TRIM(v.club))
+        WHERE h.birth_year >= ?
+        ORDER BY v.key_id, h.changed_at DESC
+    """
+
+    # Eligible history rows for a list of first-name variants, see _history_variants_sql
+    _SQL_HISTORY_VARIANTS = """
+        SELECT first_name_norm, interne_lizenznr, first_name, last_name, club, birth_year,
+               gender, district, age_class, region
+        FROM player_history
+        WHERE first_name_norm IN ({placeholders})
+        AND last_name_norm = LOWER(TRIM(?))
+        AND club_norm = LOWER(TRIM(?))
+        AND birth_year >= ?
+        ORDER BY changed_at DESC
+    """
+
     def __init__(self, db_path: str = "ttbw_players.db", config_file: str = "config.yaml"):
         self.db_path = db_path
         self.config = self._load_config(config_file)
+        self._age_classes = self.config.get('age_classes', {})
+        self._default_age_class = self._age_classes.get(self.config.get('default_birth_year', 2014), 11)
+        # Oldest birth year that has an age class defined; None accepts all players
+        self._min_eligible_birth_year = min(self._age_classes) if self._age_classes else None
+        # The same bound as a SQL parameter, for filtering history lookups (0 accepts all)
+        self._min_birth_year_param = self._min_eligible_birth_year if self._min_eligible_birth_year is not None else 0
+        self._name_club_idx = None  # built lazily by _build_lookup_index
+        self._conn: Optional[sqlite3.Connection] = None  # opened lazily by _get_connection
+        self._fuzzy_matches: List[Tuple] = []  # rows in _FUZZY_COLS order, see _log_fuzzy_match
         self.init_database()
 
     def _load_config(self, config_file: str) -> Dict[str, Any]:
@@ -77,7 +244,7 @@ class TTBWDatabase:
 
     def init_database(self) -> None:
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Create current players table
@@ -123,19 +290,36 @@ class TTBWDatabase:
                 )
             """)
 
-            # Create indexes for better performance
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_current_players_name 
-                ON current_players(last_name, first_name)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_current_players_club 
-                ON current_players(club)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_history_lizenznr 
-                ON player_history(interne_lizenznr)
-            """)
+            # Add the normalized columns to tables created before they existed
+            for table in ('current_players', 'player_history'):
+                existing_columns = {row[1] for row in cursor.execute(f"PRAGMA table_xinfo({table})")}
+                for column, source in self._NORMALIZED_COLUMNS:
+                    if column not in existing_columns:
+                        cursor.execute(f"""
+                            ALTER TABLE {table} ADD COLUMN {column} TEXT
+                            GENERATED ALWAYS AS (LOWER(TRIM({source}))) VIRTUAL
+                        """)
+
+            # Create indexes for better performance, replacing ones whose definition changed
+            # (the name/club indexes used to cover the raw columns)
+            index_sql = dict(cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index'"))
+            for name, definition in self._SECONDARY_INDEXES:
+                if name in index_sql and definition not in (index_sql[name] or ''):
+                    cursor.execute(f"DROP INDEX {name}")
+            self._create_secondary_indexes(cursor)
+
+            # Record inserts and tracked-field updates in the history table
+            cursor.execute(self._SQL_CREATE_HISTORY_TRIGGER.format(
+                name='trg_current_players_insert', event='INSERT', when='1',
+                change_type='INSERT', previous_club='NULL', previous_district='NULL'))
+            cursor.execute(self._SQL_CREATE_HISTORY_TRIGGER.format(
+                name='trg_current_players_update', event='UPDATE',
+                when="""OLD.first_name IS NOT NEW.first_name OR OLD.last_name IS NOT NEW.last_name
+                  OR OLD.club IS NOT NEW.club OR OLD.gender IS NOT NEW.gender
+                  OR OLD.district IS NOT NEW.district OR OLD.birth_year IS NOT NEW.birth_year
+                  OR OLD.age_class IS NOT NEW.age_class OR OLD.region IS NOT NEW.region
+                  OR OLD.qttr IS NOT NEW.qttr OR OLD.club_number IS NOT NEW.club_number""",
+                change_type='UPDATE', previous_club='OLD.club', previous_district='OLD.district'))
 
             conn.commit()
             logger.info("Database initialized successfully")
@@ -143,29 +327,159 @@ class TTBWDatabase:
             # Add unique constraint to history table to prevent duplicates
             self.add_unique_constraint_to_history()
 
-    def load_players_from_csv(self, csv_file: str) -> int:
+    def _create_secondary_indexes(self, cursor: sqlite3.Cursor) -> None:
+        """Create the secondary indexes if they do not exist."""
+        for name, definition in self._SECONDARY_INDEXES:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+
+    def bulk_load(self, csv_file: str) -> int:
+        """
+        Load players from CSV file with secondary indexes dropped during the load.
+        Meant for initial builds and full re-ingests; returns the number of players processed.
+        """
+        return self.load_players_from_csv(csv_file, bulk=True)
+
+    def load_players_from_csv(self, csv_file: str, bulk: bool = False) -> int:
         """
         Load players from CSV file and update database.
+        With bulk=True the secondary indexes are dropped for the load and rebuilt
+        once at the end, all in one transaction.
         Returns the number of players processed.
         """
         try:
-            df = pd.read_csv(csv_file, delimiter=';', encoding='latin1')
-            logger.info(f"Loaded CSV with {len(df)} rows")
+            # Read every field as a plain string; empty cells stay '' instead of becoming NaN
+            reader = pd.read_csv(csv_file, delimiter=';', encoding='latin1', dtype=str,
+                                 na_filter=False, keep_default_na=False,
+                                 chunksize=self._INGEST_BATCH_SIZE)
+
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+
+                # Preload the compared columns once instead of probing the table per row
+                existing = {row[0]: row[1:] for row in cursor.execute("""
+                    SELECT interne_lizenznr, first_name, last_name, club, gender, district,
+                           birth_year, age_class, region, qttr, club_number
+                    FROM current_players
+                """)}
+
+                if bulk:
+                    cursor.execute("BEGIN")
+                    for name, _ in self._SECONDARY_INDEXES:
+                        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+                # One transaction across all chunks; each chunk is flushed with executemany
+                rows_read = players_processed = players_inserted = players_updated = 0
+                for chunk in reader:
+                    rows_read += len(chunk)
+                    inserts, updates, processed = self._prepare_chunk(chunk, existing)
+                    self._write_player_changes(cursor, inserts, updates)
+                    players_processed += processed
+                    players_inserted += len(inserts)
+                    players_updated += len(updates)
+
+                if bulk:
+                    self._create_secondary_indexes(cursor)
+                conn.commit()
 
-            players_processed = 0
-            for index, row in df.iterrows():
-                if self._process_csv_row(row):
-                    players_processed += 1
+                # Refresh the planner statistics once the new data is in place
+                if players_inserted or players_updated:
+                    cursor.execute("ANALYZE")
+                    cursor.execute("PRAGMA optimize")
 
-            logger.info(f"Processed {players_processed} players from CSV")
+            self._invalidate_lookup_index()
+
+            logger.info("Processed %s players from %s CSV rows (%s new, %s updated)",
+                        players_processed, rows_read, players_inserted, players_updated)
             return players_processed
 
         except Exception as e:
-            logger.error(f"Error loading CSV file: {e}")
+            logger.error("Error loading CSV file: %s", e)
             return 0
 
-    def _process_csv_row(self, row: pd.Series) -> bool:
+    def _prepare_chunk(self, chunk: pd.DataFrame,
+                       existing: Dict[str, Tuple]) -> Tuple[List[Tuple], List[Tuple], int]:
+        """
+        Build current_players rows for a CSV chunk and split them into inserts and updates.
+        existing maps licence numbers to their stored fields and is updated in place.
+        Returns (inserts, updates, number of valid player rows).
+        """
+        def column(name: str) -> pd.Series:
+            return chunk[name] if name in chunk.columns else pd.Series('', index=chunk.index)
+
+        # Parse all birth years in one pass and drop rows without a usable date
+        birth_dates = column('Geburtsdatum')
+        birth_years = self._parse_birth_years(birth_dates)
+        for index, birth_date in birth_dates[birth_years.isna() & (birth_dates != '')].items():
+            row = chunk.loc[index]
+            logger.warning("Could not parse birth date '%s' for player %s %s",
+                           birth_date, row.get('Vorname', ''), row.get('Nachname', ''))
+
+        # Keep TTBW rows with all essential fields; empty cells are read as ''
+        valid = (birth_years.notna() & (column('Verband') == 'TTBW') & (column('Nachname') != '') &
+                 (column('Vorname') != '') & (column('InterneNr') != ''))
+        chunk, birth_years = chunk[valid], birth_years[valid].astype('int64')
+
+        districts = column('Region')
+        club_numbers = column('VereinNr')
+        if 'VereinNr' in chunk.columns:
+            # An empty VereinNr cell is stored as NULL, a file without the column as ''
+            club_numbers = club_numbers.where(club_numbers != '', None)
+
+        # Whole-column derivations instead of per-row branches and lookups
+        frame = pd.DataFrame({
+            'interne_lizenznr': column('InterneNr'),
+            'first_name': column('Vorname'),
+            'last_name': column('Nachname'),
+            'club': column('VereinName'),
+            'gender': np.where(column('Anrede').to_numpy() == 'Herr', 'Jungen', 'Mädchen'),
+            'district': districts,
+            'birth_year': birth_years,
+            'age_class': birth_years.map(self._age_classes).fillna(self._default_age_class).astype('int64'),
+            'region': districts.map({d: self._get_region_from_district(d) for d in districts.unique()}),
+            'qttr': None,
+            'club_number': club_numbers,
+            'verband': column('Verband'),
+        }, index=chunk.index)
+
+        inserts, updates = [], []
+        for values in frame.itertuples(index=False, name=None):
+            interne_lizenznr, fields = values[0], values[1:11]
+            existing_player = existing.get(interne_lizenznr)
+            if existing_player is None:
+                inserts.append(values)
+            elif existing_player != fields:
+                updates.append(values)
+            else:
+                continue
+            # Later rows with the same licence number compare against this one
+            existing[interne_lizenznr] = fields
+
+        return inserts, updates, len(frame)
+
+    @staticmethod
+    def _parse_birth_years(birth_dates: pd.Series) -> pd.Series:
+        """
+        Parse birth years for a whole column of birth dates.
+        Accepts DD.MM.YYYY dates and bare years, ignoring surrounding whitespace;
+        anything else becomes <NA>.
+        """
+        text = birth_dates.astype(str).str.strip()
+        return pd.to_numeric(text.str.extract(r'^(?:\d{1,2}\.\d{1,2}\.)?(\d{4})$')[0]).astype('Int32')
+
+    def _process_csv_row(self, row: Mapping[str, Any]) -> bool:
         """Process a single CSV row and update database."""
+        player_record = self._build_player_record(row)
+        if player_record is None:
+            return False
+        try:
+            self._update_player_in_database(player_record)
+            return True
+        except Exception as e:
+            logger.error("Error processing row %s: %s", row.get('InterneNr', 'unknown'), e)
+            return False
+
+    def _build_player_record(self, row: Mapping[str, Any]) -> Optional[PlayerRecord]:
+        """Build a PlayerRecord from a CSV row, or None if the row is skipped."""
         try:
             # Extract values from the row
             verband = row.get('Verband', '')
@@ -178,24 +492,21 @@ class TTBWDatabase:
             birth_date = row.get('Geburtsdatum', '')
             interne_lizenznr = row.get('InterneNr', '')
             
-            # Skip if essential fields are missing
-            if pd.isna(last_name) or pd.isna(first_name) or pd.isna(interne_lizenznr) or pd.isna(birth_date):
-                return False
+            # Skip if essential fields are missing (empty cells are read as '')
+            if not (last_name and first_name and interne_lizenznr and birth_date):
+                return None
             
             # Skip if not TTBW
             if verband != 'TTBW':
-                return False
-            
-            # Extract birth year from birth date (assuming format DD.MM.YYYY)
-            try:
-                if isinstance(birth_date, str) and '.' in birth_date:
-                    birth_year = int(birth_date.split('.')[-1])
-                else:
-                    birth_year = int(birth_date)
-            except (ValueError, TypeError):
-                logger.warning(f"Could not parse birth date '{birth_date}' for player {first_name} {last_name}")
-                return False
+                return None
             
+            # Extract birth year from birth date, with the same rules as the bulk ingest
+            birth_year = self._parse_birth_years(pd.Series([birth_date], dtype=object)).iloc[0]
+            if pd.isna(birth_year):
+                logger.warning("Could not parse birth date '%s' for player %s %s", birth_date, first_name, last_name)
+                return None
+            birth_year = int(birth_year)
+
             # Note: We load ALL players into the database, regardless of age
             # Age filtering is applied later during tournament result processing
             
@@ -216,36 +527,28 @@ class TTBWDatabase:
                 birth_year=birth_year,
                 age_class=age_class,
                 region=self._get_region_from_district(district),
-                club_number=str(club_number) if not pd.isna(club_number) else None,
+                # An empty VereinNr cell is stored as NULL, a file without the column as ''
+                club_number=str(club_number) if club_number != '' or 'VereinNr' not in row else None,
                 verband=verband
             )
-            
-            # Update database
-            self._update_player_in_database(player_record)
-            return True
-            
+            return player_record
+
         except Exception as e:
-            logger.error(f"Error processing row {row.get('InterneNr', 'unknown')}: {e}")
-            return False
+            logger.error("Error processing row %s: %s", row.get('InterneNr', 'unknown'), e)
+            return None
     
     def _is_player_age_eligible(self, birth_year: int) -> bool:
         """Check if player's birth year is within the eligible age range for tournament processing."""
-        age_classes = self.config.get('age_classes', {})
-        if not age_classes:
+        if self._min_eligible_birth_year is None:
             return True  # If no age classes defined, accept all players
-        
-        # Find the oldest birth year that has an age class defined
-        oldest_eligible_birth_year = min(age_classes.keys())
-        
+
         # Player is eligible if their birth year is >= oldest eligible birth year
         # (i.e., not older than the oldest defined age class)
-        return birth_year >= oldest_eligible_birth_year
+        return birth_year >= self._min_eligible_birth_year
     
     def _calculate_age_class(self, birth_year: int) -> int:
         """Calculate age class based on birth year from config."""
-        age_class_mapping = self.config.get('age_classes', {})
-        default_age_class = age_class_mapping.get(self.config.get('default_birth_year', 2014), 11)
-        return age_class_mapping.get(birth_year, default_age_class)
+        return self._age_classes.get(birth_year, self._default_age_class)
 
     def _get_region_from_district(self, district: str) -> int:
         """Get region number from district name from config."""
@@ -269,185 +572,91 @@ class TTBWDatabase:
         return 1
 
     def _update_player_in_database(self, player_record: PlayerRecord) -> None:
-        """Update player record in database, tracking changes."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Update player record in database; history is recorded by triggers."""
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if player exists
-            cursor.execute("""
-                SELECT * FROM current_players WHERE interne_lizenznr = ?
-            """, (player_record.interne_lizenznr,))
-
-            existing_player = cursor.fetchone()
-
-            if existing_player:
-                # Player exists, check for changes
-                if self._has_changes(existing_player, player_record):
-                    # Record the change in history
-                    self._record_change(cursor, existing_player, player_record, 'UPDATE')
-
-                    # Update current record
-                    cursor.execute("""
-                        UPDATE current_players SET
-                            first_name = ?, last_name = ?, club = ?, gender = ?,
-                            district = ?, birth_year = ?, age_class = ?, region = ?,
-                            qttr = ?, club_number = ?, verband = ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE interne_lizenznr = ?
-                    """, (
-                        player_record.first_name, player_record.last_name, player_record.club,
-                        player_record.gender, player_record.district, player_record.birth_year,
-                        player_record.age_class, player_record.region, player_record.qttr,
-                        player_record.club_number, player_record.verband,
-                        player_record.interne_lizenznr
-                    ))
-                    logger.info(f"Updated player {player_record.first_name} {player_record.last_name}")
-                else:
-                    logger.debug(f"No changes for player {player_record.first_name} {player_record.last_name}")
+            # Insert, or update only if a tracked field changed
+            cursor.execute(self._SQL_UPSERT_PLAYER, self._player_values(player_record))
+
+            if cursor.rowcount:
+                logger.info("Stored player %s %s", player_record.first_name, player_record.last_name)
             else:
-                # New player
-                cursor.execute("""
-                    INSERT INTO current_players (
-                        interne_lizenznr, first_name, last_name, club, gender, district,
-                        birth_year, age_class, region, qttr, club_number, verband
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    player_record.interne_lizenznr, player_record.first_name, player_record.last_name,
-                    player_record.club, player_record.gender, player_record.district,
-                    player_record.birth_year, player_record.age_class, player_record.region,
-                    player_record.qttr, player_record.club_number, player_record.verband
-                ))
-
-                # Record the insertion
-                self._record_change(cursor, None, player_record, 'INSERT')
-                logger.info(f"Added new player {player_record.first_name} {player_record.last_name}")
+                logger.debug("No changes for player %s %s", player_record.first_name, player_record.last_name)
 
             conn.commit()
+            self._invalidate_lookup_index()
 
-    def _has_changes(self, existing_player: Tuple, new_record: PlayerRecord) -> bool:
-        """Check if there are changes between existing and new player record."""
-        # existing_player is a tuple from database query
-        # Compare relevant fields (excluding timestamps and auto-increment fields)
+    @staticmethod
+    def _player_values(record: PlayerRecord) -> Tuple:
+        """Build the current_players parameter tuple for a player."""
         return (
-                existing_player[1] != new_record.first_name or  # first_name
-                existing_player[2] != new_record.last_name or  # last_name
-                existing_player[3] != new_record.club or  # club
-                existing_player[4] != new_record.gender or  # gender
-                existing_player[5] != new_record.district or  # district
-                existing_player[6] != new_record.birth_year or  # birth_year
-                existing_player[7] != new_record.age_class or  # age_class
-                existing_player[8] != new_record.region or  # region
-                existing_player[9] != new_record.qttr or  # qttr
-                existing_player[10] != new_record.club_number  # club_number
+            record.interne_lizenznr, record.first_name, record.last_name, record.club,
+            record.gender, record.district, record.birth_year, record.age_class,
+            record.region, record.qttr, record.club_number, record.verband
         )
 
-    def _record_change(self, cursor: sqlite3.Cursor, old_record: Optional[Tuple],
-                       new_record: PlayerRecord, change_type: str) -> None:
-        """Record a change in the history table."""
-        previous_club = old_record[3] if old_record else None
-        previous_district = old_record[5] if old_record else None
-
-        # Check if this exact change already exists to prevent duplicates
-        cursor.execute("""
-            SELECT COUNT(*) FROM player_history 
-            WHERE interne_lizenznr = ? 
-            AND first_name = ? 
-            AND last_name = ? 
-            AND club = ? 
-            AND gender = ? 
-            AND district = ? 
-            AND birth_year = ? 
-            AND age_class = ? 
-            AND region = ? 
-            AND COALESCE(qttr, '') = COALESCE(?, '')
-            AND COALESCE(club_number, '') = COALESCE(?, '')
-            AND verband = ? 
-            AND change_type = ? 
-            AND COALESCE(previous_club, '') = COALESCE(?, '')
-            AND COALESCE(previous_district, '') = COALESCE(?, '')
-        """, (
-            new_record.interne_lizenznr, new_record.first_name, new_record.last_name,
-            new_record.club, new_record.gender, new_record.district,
-            new_record.birth_year, new_record.age_class, new_record.region,
-            new_record.qttr, new_record.club_number, new_record.verband,
-            change_type, previous_club, previous_district
-        ))
-
-        if cursor.fetchone()[0] == 0:
-            # Only insert if this change doesn't already exist
-            cursor.execute("""
-                INSERT INTO player_history (
-                    interne_lizenznr, first_name, last_name, club, gender, district,
-                    birth_year, age_class, region, qttr, club_number, verband,
-                    change_type, previous_club, previous_district
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                new_record.interne_lizenznr, new_record.first_name, new_record.last_name,
-                new_record.club, new_record.gender, new_record.district,
-                new_record.birth_year, new_record.age_class, new_record.region,
-                new_record.qttr, new_record.club_number, new_record.verband,
-                change_type, previous_club, previous_district
-            ))
-        else:
-            logger.debug(f"Skipping duplicate change record for {new_record.first_name} {new_record.last_name}")
+    def _write_player_changes(self, cursor: sqlite3.Cursor, inserts: List[Tuple], updates: List[Tuple]) -> None:
+        """Write batches of current_players rows; triggers record the history. The caller commits."""
+        cursor.executemany(self._SQL_UPSERT_PLAYER, inserts + updates)
 
-    def _get_name_variants(self, name: str) -> List[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_name_variants(name: str) -> Tuple[str, ...]:
         """Get common name variants for fuzzy matching."""
-        if name is None:
-            return []
-        name = name.lower().strip()
-        variants = [name]  # Always include the original name
-        
-        # Common name variations
-        name_variants = {
-            'marc': ['mark'],
-            'mark': ['marc'],
-            'luis': ['louis'],
-            'louis': ['luis'],
-            'mukherjee': ['mukherjee'],  # Keep as is for now
-            'd´elia': ['d?elia', 'd\'elia', 'delia'],  # Handle encoding variations
-            'd?elia': ['d´elia', 'd\'elia', 'delia'],
-            'd\'elia': ['d´elia', 'd?elia', 'delia'],
-            'delia': ['d´elia', 'd?elia', 'd\'elia'],
-            'kleiss': ['kleiss'],  # Keep as is for now
-            'löwe': ['löwe', 'loewe'],  # Handle umlaut variations
-            'loewe': ['löwe'],
-            'titus': ['titus'],  # Keep as is for now
-            'kleiss': ['kleiß'],  # Keep as is for now
-            'kleis': ['kleiß'],  # Keep as is for now
-            'kleiß': ['kleiss', 'kleis']  # Keep as is for now
-        }
-        
-        if name in name_variants:
-            variants.extend(name_variants[name])
-        
-        # Add encoding-normalized variants
-        normalized_name = self._normalize_encoding(name)
-        if normalized_name != name and normalized_name not in variants:
-            variants.append(normalized_name)
-        
-        return variants
+        # Cached as a tuple so callers cannot modify the shared result
+        return tuple(NameUtils.get_name_variants(name))
 
-    def _normalize_encoding(self, name: str) -> str:
+    @staticmethod
+    def _normalize_encoding(name: str) -> str:
         """Normalize common encoding variations in names."""
-        # Handle common encoding issues
-        encoding_variants = {
-            'd´elia': 'delia',      # Smart quote to regular apostrophe
-            'd?elia': 'delia',      # Question mark to regular apostrophe
-            'd\'elia': 'delia',     # Regular apostrophe
-            'd´': 'd\'',            # Smart quote to regular apostrophe
-            'd?': 'd\'',            # Question mark to regular apostrophe
-            'löwe': 'loewe',        # Umlaut to oe
-            'ö': 'oe',              # Umlaut to oe
-            'ü': 'ue',              # Umlaut to ue
-            'ä': 'ae',              # Umlaut to ae
-            'ß': 'ss'               # Sharp s to ss
-        }
-        
-        normalized = name
-        for variant, standard in encoding_variants.items():
-            normalized = normalized.replace(variant, standard)
-        
-        return normalized
+        return NameUtils.normalize_encoding(name)
+
+    @staticmethod
+    def _lookup_key(name: Optional[str]) -> Optional[str]:
+        """Normalize a name or club exactly like SQLite's LOWER(TRIM(...)) in the history lookups."""
+        if name is None:
+            return None
+        # TRIM() only removes spaces and LOWER() only folds ASCII letters
+        name = name.strip(' ')
+        return name.lower() if name.isascii() else name.translate(_SQL_LOWER)
+
+    def _build_lookup_index(self) -> None:
+        """Load current players into in-memory hash indexes for name/club lookups."""
+        name_club_idx: Dict[Tuple[str, str, str], List[Tuple]] = {}
+        name_idx: Dict[Tuple[str, str], List[Tuple]] = {}
+        last_club_keys: Set[Tuple[str, str]] = set()
+        club_idx: Dict[str, List[Tuple]] = {}
+        license_idx: Dict[str, Tuple] = {}
+
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT interne_lizenznr, first_name, last_name, club, club_number, birth_year
+                FROM current_players
+            """).fetchall()
+            history_clubs = [row[0] for row in conn.execute("SELECT DISTINCT club FROM player_history")]
+
+        for row in rows:
+            first, last, club = self._lookup_key(row[1]), self._lookup_key(row[2]), self._lookup_key(row[3])
+            name_club_idx.setdefault((first, last, club), []).append(row)
+            name_idx.setdefault((first, last), []).append(row)
+            last_club_keys.add((last, club))
+            club_idx.setdefault(club, []).append(row)
+            license_idx[row[0]] = row
+
+        self._name_club_idx = name_club_idx
+        self._name_idx = name_idx
+        self._last_club_keys = last_club_keys
+        self._club_idx = club_idx
+        self._license_idx = license_idx
+        self._known_clubs = frozenset(club_idx)
+        # Clubs of current players plus former clubs recorded in the history
+        self._history_clubs = self._known_clubs.union(map(self._lookup_key, history_clubs))
+        logger.debug("Built player lookup index with %s players", len(rows))
+
+    def _invalidate_lookup_index(self) -> None:
+        """Drop the in-memory lookup index after current_players has been written."""
+        self._name_club_idx = None
 
     def find_player_by_name_and_club(self, first_name: str, last_name: str,
                                      club: str, club_number: Optional[str] = None) -> Optional[str]:
@@ -456,224 +665,245 @@ class TTBWDatabase:
         Returns the interne_lizenznr if found, None otherwise.
         Only returns players who are age-eligible.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        player_id = self._match_current_player(first_name, last_name, club, club_number)
+        if player_id or self._is_unknown_club(club):
+            return player_id
+
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Try to find by exact name and club match (with age eligibility check)
-            cursor.execute("""
-                SELECT interne_lizenznr, birth_year FROM current_players 
-                WHERE LOWER(TRIM(first_name)) = LOWER(TRIM(?)) 
-                AND LOWER(TRIM(last_name)) = LOWER(TRIM(?))
-                AND LOWER(TRIM(club)) = LOWER(TRIM(?))
-            """, (first_name, last_name, club))
+            # If no match found in current_players, search the history table
+            # This handles cases where CSV was updated and old names are in history
+            cursor.execute(self._SQL_HISTORY_MATCH, (first_name, last_name, club, self._min_birth_year_param))
 
-            result = cursor.fetchone()
-            if result:
-                player_id, birth_year = result
+            player_id = self._accept_history_match(cursor.fetchone(), first_name, last_name, club)
+            if player_id:
+                return player_id
+
+            player_id = self._match_history_variants(cursor, first_name, last_name, club)
+            if player_id:
+                return player_id
+
+        return self._match_name_typo(first_name, last_name, club)
+
+    def find_players_bulk(self, keys: Iterable[Tuple[str, str, str, Optional[str]]]) -> Dict[Tuple, Optional[str]]:
+        """
+        Find many players at once; keys are (first_name, last_name, club, club_number) tuples.
+        Returns a dict mapping each key to its interne_lizenznr, or None if not found.
+        Same matching rules as find_player_by_name_and_club, but the history lookups for all
+        keys not found among the current players run as two joins against staged keys.
+        """
+        results: Dict[Tuple, Optional[str]] = {}
+        misses = []
+        for key in keys:
+            if key not in results:
+                results[key] = self._match_current_player(*key)
+                if results[key] is None and not self._is_unknown_club(key[2]):
+                    misses.append(key)
+
+        if not misses:
+            return results
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS lookup_keys (first_name TEXT, last_name TEXT, club TEXT)")
+            cursor.execute("DELETE FROM lookup_keys")
+            cursor.executemany("INSERT INTO lookup_keys (rowid, first_name, last_name, club) VALUES (?, ?, ?, ?)",
+                               [(i, first, last, club) for i, (first, last, club, _) in enumerate(misses)])
+
+            # Most recent history row per key, as the single-player lookup does with LIMIT 1
+            history_rows: Dict[int, Tuple] = {}
+            for row in cursor.execute(self._SQL_HISTORY_MATCH_BATCH, (self._min_birth_year_param,)).fetchall():
+                history_rows.setdefault(row[0], row[1:])
+
+            unmatched = []
+            for i, (first_name, last_name, club, club_number) in enumerate(misses):
+                results[misses[i]] = self._accept_history_match(history_rows.get(i), first_name, last_name, club)
+                if results[misses[i]] is None:
+                    unmatched.append(i)
+
+            # Stage the first-name variants of all remaining keys and fetch their history rows in one join
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS lookup_variants "
+                           "(key_id INTEGER, first_name TEXT, last_name TEXT, club TEXT)")
+            cursor.execute("DELETE FROM lookup_variants")
+            cursor.executemany("INSERT INTO lookup_variants (key_id, first_name, last_name, club) VALUES (?, ?, ?, ?)",
+                               [(i, variant, misses[i][1], misses[i][2])
+                                for i in unmatched for variant in self._history_variants(misses[i][0])])
+
+            # Most recent history row per key and variant
+            variant_rows: Dict[int, Dict[str, Tuple]] = {i: {} for i in unmatched}
+            for row in cursor.execute(self._SQL_HISTORY_VARIANTS_BATCH, (self._min_birth_year_param,)).fetchall():
+                variant_rows[row[0]].setdefault(row[1], row[2:])
+
+            for i in unmatched:
+                first_name, last_name, club, club_number = misses[i]
+                player_id = self._match_history_variants(cursor, first_name, last_name, club, variant_rows[i])
+                if player_id is None:
+                    player_id = self._match_name_typo(first_name, last_name, club)
+                results[misses[i]] = player_id
+
+            cursor.execute("DELETE FROM lookup_keys")
+            cursor.execute("DELETE FROM lookup_variants")
+
+        return results
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _history_variants_sql(count: int) -> str:
+        """History variant query for count variants; one fixed SQL text per count keeps it in the statement cache."""
+        return TTBWDatabase._SQL_HISTORY_VARIANTS.format(placeholders=','.join('?' * count))
+
+    def _is_unknown_club(self, club: str) -> bool:
+        """
+        Check whether a club appears neither among the current players nor in the history,
+        in which case no history lookup can match. Warns about such clubs.
+        """
+        if self._name_club_idx is None:
+            self._build_lookup_index()
+        if self._lookup_key(club) in self._history_clubs:
+            return False
+        logger.warning("CLUB NOT FOUND: Club '%s' is not in the database - likely not part of considered regions", club)
+        return True
+
+    def _match_current_player(self, first_name: str, last_name: str,
+                              club: str, club_number: Optional[str] = None) -> Optional[str]:
+        """Match a player against the current players (in-memory index); None if not found."""
+        if self._name_club_idx is None:
+            self._build_lookup_index()
+
+        first_key, last_key, club_key = self._lookup_key(first_name), self._lookup_key(last_name), self._lookup_key(club)
+
+        # Try to find by exact name and club match (with age eligibility check)
+        results = self._name_club_idx.get((first_key, last_key, club_key))
+        if results:
+            player_id, _, _, _, _, birth_year = results[0]
+            # Check age eligibility before returning
+            if self._is_player_age_eligible(birth_year):
+                return player_id
+            else:
+                logger.debug("Player %s %s (birth year %s) is too old for age classes", first_name, last_name, birth_year)
+
+        # If club number is provided, try matching by name and club number
+        if club_number:
+            # First try matching by name and club number
+            results = [row for row in self._name_idx.get((first_key, last_key), ()) if row[4] == club_number]
+            if results:
+                player_id, _, _, _, _, birth_year = results[0]
                 # Check age eligibility before returning
                 if self._is_player_age_eligible(birth_year):
                     return player_id
                 else:
-                    logger.debug(f"Player {first_name} {last_name} (birth year {birth_year}) is too old for age classes")
-
-            # If club number is provided, try matching by name and club number
-            if club_number:
-                # First try matching by name and club number
-                cursor.execute("""
-                    SELECT interne_lizenznr, birth_year FROM current_players 
-                    WHERE LOWER(TRIM(first_name)) = LOWER(TRIM(?)) 
-                    AND LOWER(TRIM(last_name)) = LOWER(TRIM(?))
-                    AND club_number = ?
-                """, (first_name, last_name, club_number))
-
-                result = cursor.fetchone()
+                    logger.debug("Player %s %s (birth year %s) is too old for age classes", first_name, last_name, birth_year)
+
+            # If club number looks like a license ID, try matching by license ID
+            if len(club_number) >= 8:  # License IDs are typically 8+ characters
+                result = self._license_idx.get(club_number)
                 if result:
-                    player_id, birth_year = result
+                    player_id, db_first_name, db_last_name, club_name, _, birth_year = result
                     # Check age eligibility before returning
                     if self._is_player_age_eligible(birth_year):
+                        logger.info("LICENSE ID MATCH: Found player by license ID %s: %s %s (tournament: %s %s)", club_number, db_first_name, db_last_name, first_name, last_name)
+                        # Log the fuzzy match for reporting
+                        self._log_fuzzy_match(
+                            tournament_name="",  # We don't have tournament name in this context
+                            db_name=f"{db_first_name} {db_last_name}",
+                            tournament_club=club,
+                            db_club=club_name,
+                            tournament_first=first_name,
+                            tournament_last=last_name,
+                            db_first=db_first_name,
+                            db_last=last_name
+                        )
                         return player_id
                     else:
-                        logger.debug(f"Player {first_name} {last_name} (birth year {birth_year}) is too old for age classes")
-                
-                # If club number looks like a license ID, try matching by license ID
-                if len(club_number) >= 8:  # License IDs are typically 8+ characters
-                    cursor.execute("""
-                        SELECT interne_lizenznr, first_name, last_name, club, birth_year FROM current_players 
-                        WHERE interne_lizenznr = ?
-                    """, (club_number,))
-
-                    result = cursor.fetchone()
-                    if result:
-                        player_id, db_first_name, db_last_name, club_name, birth_year = result
-                        # Check age eligibility before returning
-                        if self._is_player_age_eligible(birth_year):
-                            logger.info(f"LICENSE ID MATCH: Found player by license ID {club_number}: {db_first_name} {db_last_name} (tournament: {first_name} {last_name})")
-                            # Log the fuzzy match for reporting
-                            self._log_fuzzy_match(
-                                tournament_name="",  # We don't have tournament name in this context
-                                db_name=f"{db_first_name} {db_last_name}",
-                                tournament_club=club,
-                                db_club=club_name,
-                                tournament_first=first_name,
-                                tournament_last=last_name,
-                                db_first=db_first_name,
-                                db_last=last_name
-                            )
-                            return player_id
-                        else:
-                            logger.debug(f"Player {db_first_name} {db_last_name} (birth year {birth_year}) is too old for age classes")
-
-            # Try fuzzy matching by name only (in case club has changed)
-            cursor.execute("""
-                SELECT interne_lizenznr, club, birth_year FROM current_players 
-                WHERE LOWER(TRIM(first_name)) = LOWER(TRIM(?)) 
-                AND LOWER(TRIM(last_name)) = LOWER(TRIM(?))
-            """, (first_name, last_name))
-
-            results = cursor.fetchall()
-            if len(results) == 1:
-                player_id, club_name, birth_year = results[0]
-                # Check age eligibility before returning
+                        logger.debug("Player %s %s (birth year %s) is too old for age classes", db_first_name, db_last_name, birth_year)
+
+        # Try fuzzy matching by name only (in case club has changed)
+        results = self._name_idx.get((first_key, last_key), [])
+        if len(results) == 1:
+            player_id, _, _, club_name, _, birth_year = results[0]
+            # Check age eligibility before returning
+            if self._is_player_age_eligible(birth_year):
+                return player_id
+            else:
+                logger.debug("Player %s %s (birth year %s) is too old for age classes", first_name, last_name, birth_year)
+        elif len(results) > 1:
+            # Multiple matches, find the first age-eligible one
+            for player_id, _, _, club_name, _, birth_year in results:
                 if self._is_player_age_eligible(birth_year):
+                    logger.debug("Multiple players found for %s %s, using age-eligible one: %s", first_name, last_name, player_id)
                     return player_id
-                else:
-                    logger.debug(f"Player {first_name} {last_name} (birth year {birth_year}) is too old for age classes")
-            elif len(results) > 1:
-                # Multiple matches, find the first age-eligible one
-                for player_id, club_name, birth_year in results:
-                    if self._is_player_age_eligible(birth_year):
-                        logger.debug(f"Multiple players found for {first_name} {last_name}, using age-eligible one: {player_id}")
-                        return player_id
-                
-                # If no age-eligible players found, log warning
-                logger.warning(f"Multiple players found for {first_name} {last_name}, but none are age-eligible: {results}")
 
-            # Try fuzzy name matching with common variants
-            first_name_variants = self._get_name_variants(first_name)
-            last_name_variants = self._get_name_variants(last_name)
-            
-            # Try matching with exact names but fuzzy club matching (for club name variations)
-            cursor.execute("""
-                SELECT interne_lizenznr, club, birth_year FROM current_players 
-                WHERE LOWER(TRIM(first_name)) = LOWER(TRIM(?)) 
-                AND LOWER(TRIM(last_name)) = LOWER(TRIM(?))
-            """, (first_name, last_name))
-
-            results = cursor.fetchall()
-            if len(results) == 1:
-                player_id, club_name, birth_year = results[0]
-                # Check age eligibility before returning
-                if self._is_player_age_eligible(birth_year):
-                    logger.info(f"FUZZY CLUB MATCH: Tournament club '{club}' matched to DB club '{club_name}' for {first_name} {last_name}")
-                    # Log the fuzzy match for reporting
-                    self._log_fuzzy_match(
-                        tournament_name="",  # We don't have tournament name in this context
-                        db_name=f"{first_name} {last_name}",
-                        tournament_club=club,
-                        db_club=club_name,
-                        tournament_first=first_name,
-                        tournament_last=last_name,
-                        db_first=first_name,
-                        db_last=last_name
-                    )
-                    return player_id
-                else:
-                    logger.debug(f"Player {first_name} {last_name} (birth year {birth_year}) is too old for age classes")
-            elif len(results) > 1:
-                # Multiple matches, find the first age-eligible one
-                for player_id, club_name, birth_year in results:
+            # If no age-eligible players found, log warning
+            logger.warning("Multiple players found for %s %s, but none are age-eligible: %s", first_name, last_name, results)
+
+        # Try fuzzy name matching with common variants
+        first_name_variants = self._get_name_variants(first_name)
+        last_name_variants = self._get_name_variants(last_name)
+        # The original name comes first among the variants, in Python's lowercase. The loops
+        # skip it by that spelling, not by the SQLite-style lookup key, as the SQL lookups did
+        first_original = first_name_variants[0] if first_name_variants else None
+        last_original = last_name_variants[0] if last_name_variants else None
+
+        # Try matching with first name variants
+        player_id = self._match_first_name_variant(first_name, last_name, club, first_name_variants,
+                                                   first_original, last_key, club_key)
+        if player_id:
+            return player_id
+
+        # Try matching with last name variants
+        for variant in last_name_variants:
+            if variant != last_original:  # Skip the original name (already tried)
+                results = self._name_club_idx.get((first_key, variant, club_key))
+                if results:
+                    player_id, _, db_last_name, club_name, _, birth_year = results[0]
+                    # Check age eligibility before returning
                     if self._is_player_age_eligible(birth_year):
-                        logger.info(f"FUZZY CLUB MATCH: Tournament club '{club}' matched to DB club '{club_name}' for {first_name} {last_name} (multiple matches, using age-eligible one)")
+                        logger.info("FUZZY MATCH: Tournament '%s' matched to DB '%s' for %s %s from %s", last_name, db_last_name, first_name, last_name, club)
                         # Log the fuzzy match for reporting
                         self._log_fuzzy_match(
                             tournament_name="",  # We don't have tournament name in this context
-                            db_name=f"{first_name} {last_name}",
+                            db_name=f"{first_name} {db_last_name}",
                             tournament_club=club,
                             db_club=club_name,
                             tournament_first=first_name,
                             tournament_last=last_name,
                             db_first=first_name,
+                            db_last=db_last_name
+                        )
+                        return player_id
+                    else:
+                        logger.debug("Player %s %s (birth year %s) is too old for age classes", first_name, last_name, birth_year)
+
+        # Try fuzzy matching by name variants only (in case club has changed)
+        for variant in first_name_variants:
+            if variant != first_original:  # Skip the original name (already tried)
+                results = self._name_idx.get((variant, last_key), [])
+                if len(results) == 1:
+                    player_id, db_first_name, _, club_name, _, birth_year = results[0]
+                    # Check age eligibility before returning
+                    if self._is_player_age_eligible(birth_year):
+                        logger.info("FUZZY MATCH: Tournament '%s' matched to DB '%s' for %s %s (club: tournament=%s, DB=%s)", first_name, db_first_name, first_name, last_name, club, club_name)
+                        # Log the fuzzy match for reporting
+                        self._log_fuzzy_match(
+                            tournament_name="",  # We don't have tournament name in this context
+                            db_name=f"{db_first_name} {last_name}",
+                            tournament_club=club,
+                            db_club=club_name,
+                            tournament_first=first_name,
+                            tournament_last=last_name,
+                            db_first=db_first_name,
                             db_last=last_name
                         )
                         return player_id
-            
-            # Try matching with first name variants
-            for variant in first_name_variants:
-                if variant != first_name.lower().strip():  # Skip the original name (already tried)
-                    cursor.execute("""
-                        SELECT interne_lizenznr, club, birth_year, first_name FROM current_players 
-                        WHERE LOWER(TRIM(first_name)) = ? 
-                        AND LOWER(TRIM(last_name)) = LOWER(TRIM(?))
-                        AND LOWER(TRIM(club)) = LOWER(TRIM(?))
-                    """, (variant, last_name, club))
-
-                    result = cursor.fetchone()
-                    if result:
-                        player_id, club_name, birth_year, db_first_name = result
-                        # Check age eligibility before returning
-                        if self._is_player_age_eligible(birth_year):
-                            logger.info(f"FUZZY MATCH: Tournament '{first_name}' matched to DB '{db_first_name}' for {first_name} {last_name} from {club}")
-                            # Log the fuzzy match for reporting
-                            self._log_fuzzy_match(
-                                tournament_name="",  # We don't have tournament name in this context
-                                db_name=f"{db_first_name} {last_name}",
-                                tournament_club=club,
-                                db_club=club_name,
-                                tournament_first=first_name,
-                                tournament_last=last_name,
-                                db_first=db_first_name,
-                                db_last=last_name
-                            )
-                            return player_id
-                        else:
-                            logger.debug(f"Player {first_name} {last_name} (birth year {birth_year}) is too old for age classes")
-
-            # Try matching with last name variants
-            for variant in last_name_variants:
-                if variant != last_name.lower().strip():  # Skip the original name (already tried)
-                    cursor.execute("""
-                        SELECT interne_lizenznr, club, birth_year, last_name FROM current_players 
-                        WHERE LOWER(TRIM(first_name)) = LOWER(TRIM(?)) 
-                        AND LOWER(TRIM(last_name)) = ?
-                        AND LOWER(TRIM(club)) = LOWER(TRIM(?))
-                    """, (first_name, variant, club))
-
-                    result = cursor.fetchone()
-                    if result:
-                        player_id, club_name, birth_year, db_last_name = result
-                        # Check age eligibility before returning
-                        if self._is_player_age_eligible(birth_year):
-                            logger.info(f"FUZZY MATCH: Tournament '{last_name}' matched to DB '{db_last_name}' for {first_name} {last_name} from {club}")
-                            # Log the fuzzy match for reporting
-                            self._log_fuzzy_match(
-                                tournament_name="",  # We don't have tournament name in this context
-                                db_name=f"{first_name} {db_last_name}",
-                                tournament_club=club,
-                                db_club=club_name,
-                                tournament_first=first_name,
-                                tournament_last=last_name,
-                                db_first=first_name,
-                                db_last=db_last_name
-                            )
-                            return player_id
-                        else:
-                            logger.debug(f"Player {first_name} {last_name} (birth year {birth_year}) is too old for age classes")
-
-            # Try fuzzy matching by name variants only (in case club has changed)
-            for variant in first_name_variants:
-                if variant != first_name.lower().strip():  # Skip the original name (already tried)
-                    cursor.execute("""
-                        SELECT interne_lizenznr, club, birth_year, first_name FROM current_players 
-                        WHERE LOWER(TRIM(first_name)) = ? 
-                        AND LOWER(TRIM(last_name)) = LOWER(TRIM(?))
-                    """, (variant, last_name))
-
-                    results = cursor.fetchall()
-                    if len(results) == 1:
-                        player_id, club_name, birth_year, db_first_name = results[0]
-                        # Check age eligibility before returning
+                    else:
+                        logger.debug("Player %s %s (birth year %s) is too old for age classes", first_name, last_name, birth_year)
+                elif len(results) > 1:
+                    # Multiple matches, find the first age-eligible one
+                    for player_id, db_first_name, _, club_name, _, birth_year in results:
                         if self._is_player_age_eligible(birth_year):
-                            logger.info(f"FUZZY MATCH: Tournament '{first_name}' matched to DB '{db_first_name}' for {first_name} {last_name} (club: tournament={club}, DB={club_name})")
+                            logger.info("FUZZY MATCH: Tournament '%s' matched to DB '%s' for %s %s (multiple matches, using age-eligible one)", first_name, db_first_name, first_name, last_name)
                             # Log the fuzzy match for reporting
                             self._log_fuzzy_match(
                                 tournament_name="",  # We don't have tournament name in this context
@@ -686,72 +916,149 @@ class TTBWDatabase:
                                 db_last=last_name
                             )
                             return player_id
-                        else:
-                            logger.debug(f"Player {first_name} {last_name} (birth year {birth_year}) is too old for age classes")
-                    elif len(results) > 1:
-                        # Multiple matches, find the first age-eligible one
-                        for player_id, club_name, birth_year, db_first_name in results:
-                            if self._is_player_age_eligible(birth_year):
-                                logger.info(f"FUZZY MATCH: Tournament '{first_name}' matched to DB '{db_first_name}' for {first_name} {last_name} (multiple matches, using age-eligible one)")
-                                # Log the fuzzy match for reporting
-                                self._log_fuzzy_match(
-                                    tournament_name="",  # We don't have tournament name in this context
-                                    db_name=f"{db_first_name} {last_name}",
-                                    tournament_club=club,
-                                    db_club=club_name,
-                                    tournament_first=first_name,
-                                    tournament_last=last_name,
-                                    db_first=db_first_name,
-                                    db_last=last_name
-                                )
-                                return player_id
-
-            # Try to find by license ID if club number is provided and looks like a license ID
-            if club_number and len(club_number) >= 8:  # License IDs are typically 8+ characters
-                cursor.execute("""
-                    SELECT interne_lizenznr, first_name, last_name, club, birth_year FROM current_players 
-                    WHERE interne_lizenznr = ?
-                """, (club_number,))
-
-                result = cursor.fetchone()
-                if result:
-                    player_id, db_first_name, db_last_name, club_name, birth_year = result
+
+        return None
+
+    def _match_first_name_variant(self, first_name: str, last_name: str, club: str,
+                                  first_name_variants: Tuple[str, ...], first_original: str,
+                                  last_key: str, club_key: str) -> Optional[str]:
+        """Match a first name variant among current players with the same last name and club."""
+        # Only players sharing last name and club can match
+        if (last_key, club_key) not in self._last_club_keys:
+            return None
+
+        for variant in first_name_variants:
+            if variant != first_original:  # Skip the original name (already tried)
+                results = self._name_club_idx.get((variant, last_key, club_key))
+                if results:
+                    player_id, db_first_name, _, club_name, _, birth_year = results[0]
                     # Check age eligibility before returning
                     if self._is_player_age_eligible(birth_year):
-                        logger.info(f"LICENSE ID MATCH: Found player by license ID {club_number}: {db_first_name} {db_last_name} (tournament: {first_name} {last_name})")
+                        logger.info("FUZZY MATCH: Tournament '%s' matched to DB '%s' for %s %s from %s", first_name, db_first_name, first_name, last_name, club)
                         # Log the fuzzy match for reporting
                         self._log_fuzzy_match(
                             tournament_name="",  # We don't have tournament name in this context
-                            db_name=f"{db_first_name} {db_last_name}",
+                            db_name=f"{db_first_name} {last_name}",
                             tournament_club=club,
                             db_club=club_name,
                             tournament_first=first_name,
                             tournament_last=last_name,
                             db_first=db_first_name,
-                            db_last=db_last_name
+                            db_last=last_name
                         )
                         return player_id
                     else:
-                        logger.debug(f"Player {db_first_name} {db_last_name} (birth year {birth_year}) is too old for age classes")
+                        logger.debug("Player %s %s (birth year %s) is too old for age classes", first_name, last_name, birth_year)
+        return None
 
-            # If no match found in current_players, search the history table
-            # This handles cases where CSV was updated and old names are in history
-            cursor.execute("""
-                SELECT interne_lizenznr, first_name, last_name, club, birth_year, gender, district, age_class, region
-                FROM player_history 
-                WHERE LOWER(TRIM(first_name)) = LOWER(TRIM(?)) 
-                AND LOWER(TRIM(last_name)) = LOWER(TRIM(?))
-                AND LOWER(TRIM(club)) = LOWER(TRIM(?))
-                ORDER BY changed_at DESC
-                LIMIT 1
-            """, (first_name, last_name, club))
+    def _match_name_typo(self, first_name: str, last_name: str, club: str) -> Optional[str]:
+        """
+        Last resort: match a name with a small typo against the players of the same club.
+        Only players whose last name starts with the same two letters are compared; the
+        match is used only if a single age-eligible player is closest.
+        """
+        if self._name_club_idx is None:
+            self._build_lookup_index()
 
-            result = cursor.fetchone()
+        first_key, last_key = self._lookup_key(first_name), self._lookup_key(last_name)
+        if not first_key or not last_key:
+            return None
+        prefix = last_key[:2]
+
+        best_distance, best_rows = None, []
+        for row in self._club_idx.get(self._lookup_key(club), ()):
+            db_last = self._lookup_key(row[2])
+            if not db_last.startswith(prefix) or not self._is_player_age_eligible(row[5]):
+                continue
+            last_distance = bounded_levenshtein(last_key, db_last, self._NAME_EDIT_TOLERANCE)
+            if last_distance is None:
+                continue
+            first_distance = bounded_levenshtein(first_key, self._lookup_key(row[1]),
+                                                 self._NAME_EDIT_TOLERANCE - last_distance)
+            if first_distance is None:
+                continue
+            distance = last_distance + first_distance
+            if best_distance is None or distance < best_distance:
+                best_distance, best_rows = distance, [row]
+            elif distance == best_distance:
+                best_rows.append(row)
+
+        if len(best_rows) != 1:
+            if best_rows:
+                logger.debug("Several players in %s are equally close to %s %s, not guessing", club, first_name, last_name)
+            return None
+
+        player_id, db_first_name, db_last_name, club_name, _, _ = best_rows[0]
+        logger.info("TYPO MATCH: Tournament '%s %s' matched to DB '%s %s' from %s", first_name, last_name, db_first_name, db_last_name, club)
+        # Log the fuzzy match for reporting
+        self._log_fuzzy_match(
+            tournament_name="",  # We don't have tournament name in this context
+            db_name=f"{db_first_name} {db_last_name}",
+            tournament_club=club,
+            db_club=club_name,
+            tournament_first=first_name,
+            tournament_last=last_name,
+            db_first=db_first_name,
+            db_last=db_last_name
+        )
+        return player_id
+
+    def _accept_history_match(self, result: Optional[Tuple], first_name: str, last_name: str,
+                              club: str) -> Optional[str]:
+        """Return the player id of an exact history match if the player is age-eligible."""
+        if result:
+            player_id, db_first_name, db_last_name, club_name, birth_year, gender, district, age_class, region = result
+            # Check age eligibility before returning
+            if self._is_player_age_eligible(birth_year):
+                logger.info("HISTORY MATCH: Found player in history: %s %s (tournament: %s %s)", db_first_name, db_last_name, first_name, last_name)
+                # Log the fuzzy match for reporting
+                self._log_fuzzy_match(
+                    tournament_name="",  # We don't have tournament name in this context
+                    db_name=f"{db_first_name} {db_last_name}",
+                    tournament_club=club,
+                    db_club=club_name,
+                    tournament_first=first_name,
+                    tournament_last=last_name,
+                    db_first=db_first_name,
+                    db_last=db_last_name
+                )
+                return player_id
+            else:
+                logger.debug("Player %s %s (birth year %s) is too old for age classes", db_first_name, db_last_name, birth_year)
+        return None
+
+    @staticmethod
+    def _history_variants(first_name: str) -> List[str]:
+        """First-name variants tried against the history table (the original name was already tried)."""
+        return [variant for variant in TTBWDatabase._get_name_variants(first_name)
+                if variant != first_name.lower().strip()]
+
+    def _match_history_variants(self, cursor: sqlite3.Cursor, first_name: str, last_name: str,
+                                club: str, latest: Optional[Dict[str, Tuple]] = None) -> Optional[str]:
+        """
+        Match first-name variants against the history table.
+        latest maps variants to their most recent history row if the caller has already fetched them.
+        """
+        # If no match found in current_players, search the history table with fuzzy name matching
+        # This handles cases where CSV was updated and old names are in history
+        variants = self._history_variants(first_name)
+
+        # All variants in one query; keep the most recent history row per variant
+        if latest is None:
+            latest = {}
+            if variants:
+                cursor.execute(self._history_variants_sql(len(variants)),
+                               (*variants, last_name, club, self._min_birth_year_param))
+                for row in cursor.fetchall():
+                    latest.setdefault(row[0], row[1:])
+
+        for variant in variants:
+            result = latest.get(variant)
             if result:
                 player_id, db_first_name, db_last_name, club_name, birth_year, gender, district, age_class, region = result
                 # Check age eligibility before returning
                 if self._is_player_age_eligible(birth_year):
-                    logger.info(f"HISTORY MATCH: Found player in history: {db_first_name} {db_last_name} (tournament: {first_name} {last_name})")
+                    logger.info("HISTORY FUZZY MATCH: Tournament '%s' matched to history '%s' for %s %s from %s", first_name, db_first_name, first_name, last_name, club)
                     # Log the fuzzy match for reporting
                     self._log_fuzzy_match(
                         tournament_name="",  # We don't have tournament name in this context
@@ -761,105 +1068,42 @@ class TTBWDatabase:
                         tournament_first=first_name,
                         tournament_last=last_name,
                         db_first=db_first_name,
-                        db_last=db_last_name
+                        db_last=last_name
                     )
                     return player_id
                 else:
-                    logger.debug(f"Player {db_first_name} {db_last_name} (birth year {birth_year}) is too old for age classes")
-
-            # If no match found in current_players, search the history table with fuzzy name matching
-            # This handles cases where CSV was updated and old names are in history
-            for variant in first_name_variants:
-                if variant != first_name.lower().strip():  # Skip the original name (already tried)
-                    cursor.execute("""
-                        SELECT interne_lizenznr, first_name, last_name, club, birth_year, gender, district, age_class, region
-                        FROM player_history 
-                        WHERE LOWER(TRIM(first_name)) = ? 
-                        AND LOWER(TRIM(last_name)) = LOWER(TRIM(?))
-                        AND LOWER(TRIM(club)) = LOWER(TRIM(?))
-                        ORDER BY changed_at DESC
-                        LIMIT 1
-                    """, (variant, last_name, club))
-
-                    result = cursor.fetchone()
-                    if result:
-                        player_id, db_first_name, db_last_name, club_name, birth_year, gender, district, age_class, region = result
-                        # Check age eligibility before returning
-                        if self._is_player_age_eligible(birth_year):
-                            logger.info(f"HISTORY FUZZY MATCH: Tournament '{first_name}' matched to history '{db_first_name}' for {first_name} {last_name} from {club}")
-                            # Log the fuzzy match for reporting
-                            self._log_fuzzy_match(
-                                tournament_name="",  # We don't have tournament name in this context
-                                db_name=f"{db_first_name} {db_last_name}",
-                                tournament_club=club,
-                                db_club=club_name,
-                                tournament_first=first_name,
-                                tournament_last=last_name,
-                                db_first=db_first_name,
-                                db_last=last_name
-                            )
-                            return player_id
-                        else:
-                            logger.debug(f"Player {db_first_name} {db_last_name} (birth year {birth_year}) is too old for age classes")
+                    logger.debug("Player %s %s (birth year %s) is too old for age classes", db_first_name, db_last_name, birth_year)
 
-            # Check if the club exists in the database at all
-            cursor.execute("""
-                SELECT COUNT(*) FROM current_players WHERE LOWER(TRIM(club)) = LOWER(TRIM(?))
-            """, (club,))
-            
-            club_exists = cursor.fetchone()[0] > 0
-            
-            if not club_exists:
-                logger.warning(f"CLUB NOT FOUND: Club '{club}' is not in the database - likely not part of considered regions")
-                return None
-
-            return None
+        # Unknown clubs were already reported by _is_unknown_club before the history lookups
+        return None
 
     def club_exists(self, club_name: str) -> bool:
         """Check if a club exists in the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT COUNT(*) FROM current_players WHERE LOWER(TRIM(club)) = LOWER(TRIM(?))
+                SELECT 1 FROM current_players WHERE club_norm = LOWER(TRIM(?)) LIMIT 1
             """, (club_name,))
-            return cursor.fetchone()[0] > 0
+            return cursor.fetchone() is not None
 
     def cleanup_duplicate_history(self) -> int:
         """Remove duplicate rows from the player_history table. Returns number of duplicates removed."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
             
-            # Create a temporary table with unique records
-            cursor.execute("""
-                CREATE TEMPORARY TABLE temp_unique_history AS
-                SELECT MIN(id) as id, interne_lizenznr, first_name, last_name, club, gender, district,
-                       birth_year, age_class, region, qttr, club_number, verband, change_type,
-                       changed_at, previous_club, previous_district
-                FROM player_history
-                GROUP BY interne_lizenznr, first_name, last_name, club, gender, district,
-                         birth_year, age_class, region, COALESCE(qttr, ''), COALESCE(club_number, ''),
-                         verband, change_type, COALESCE(previous_club, ''), COALESCE(previous_district, '')
-            """)
-            
-            # Count duplicates
-            cursor.execute("SELECT COUNT(*) FROM player_history")
-            total_before = cursor.fetchone()[0]
-            
-            # Replace the original table with deduplicated data
-            cursor.execute("DELETE FROM player_history")
+            # Keep the first row of each group of identical records, delete the rest in place
             cursor.execute("""
-                INSERT INTO player_history 
-                SELECT * FROM temp_unique_history
+                DELETE FROM player_history
+                WHERE id NOT IN (
+                    SELECT MIN(id)
+                    FROM player_history
+                    GROUP BY interne_lizenznr, first_name, last_name, club, gender, district,
+                             birth_year, age_class, region, COALESCE(qttr, ''), COALESCE(club_number, ''),
+                             verband, change_type, COALESCE(previous_club, ''), COALESCE(previous_district, '')
+                )
             """)
-            
-            # Drop temporary table
-            cursor.execute("DROP TABLE temp_unique_history")
-            
-            # Count after cleanup
-            cursor.execute("SELECT COUNT(*) FROM player_history")
-            total_after = cursor.fetchone()[0]
-            
-            duplicates_removed = total_before - total_after
+
+            duplicates_removed = cursor.rowcount
             conn.commit()
             
             if duplicates_removed > 0:
@@ -870,138 +1114,95 @@ class TTBWDatabase:
             return duplicates_removed
 
     def _get_connection(self):
-        """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        """Get the shared database connection, opening it on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, cached_statements=self._STATEMENT_CACHE_SIZE)
+            for pragma in self._CONNECTION_PRAGMAS:
+                self._conn.execute(pragma)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the shared database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def add_unique_constraint_to_history(self) -> None:
         """Add a unique constraint to the player_history table to prevent future duplicates."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            try:
+        create_index_sql = """
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_history
+            ON player_history(
+                interne_lizenznr, first_name, last_name, club, gender, district,
+                birth_year, age_class, region, COALESCE(qttr, ''), COALESCE(club_number, ''),
+                verband, change_type, COALESCE(previous_club, ''), COALESCE(previous_district, '')
+            )
+        """
+
+        try:
+            with self._get_connection() as conn:
                 # Add unique constraint on the combination of fields that should be unique
-                cursor.execute("""
-                    CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_history 
-                    ON player_history(
-                        interne_lizenznr, first_name, last_name, club, gender, district,
-                        birth_year, age_class, region, COALESCE(qttr, ''), COALESCE(club_number, ''),
-                        verband, change_type, COALESCE(previous_club, ''), COALESCE(previous_district, '')
-                    )
-                """)
-                
+                conn.execute(create_index_sql)
                 conn.commit()
                 logger.info("Added unique constraint to player_history table")
-                
-            except Exception as e:
-                logger.warning(f"Could not add unique constraint: {e}")
-                # If constraint creation fails, we'll still have duplicate prevention in the code
+        except Exception as e:
+            logger.warning(f"Could not add unique constraint: {e}")
+            # If constraint creation fails, we'll still have duplicate prevention in the code
 
     def get_fuzzy_matches_summary(self) -> List[Dict[str, str]]:
         """Get a summary of all fuzzy matches that occurred during processing."""
-        # This will be populated during fuzzy matching operations
-        if not hasattr(self, '_fuzzy_matches'):
-            self._fuzzy_matches = []
-        return self._fuzzy_matches
+        # Matches are buffered as tuples and only turned into dicts here
+        return [dict(zip(self._FUZZY_COLS, match)) for match in self._fuzzy_matches]
 
     def _log_fuzzy_match(self, tournament_name: str, db_name: str, tournament_club: str, db_club: str, 
                          tournament_first: str, tournament_last: str, db_first: str, db_last: str,
                          old_club: Optional[str] = None, current_club: Optional[str] = None) -> None:
         """Log a fuzzy match for reporting purposes."""
-        if not hasattr(self, '_fuzzy_matches'):
-            self._fuzzy_matches = []
-        
-        self._fuzzy_matches.append({
-            'tournament_name': tournament_name,
-            'db_name': db_name,
-            'tournament_club': tournament_club,
-            'db_club': db_club,
-            'tournament_first': tournament_first,
-            'tournament_last': tournament_last,
-            'db_first': db_first,
-            'db_last': db_last,
-            'old_club': old_club,
-            'current_club': current_club
-        })
+        self._fuzzy_matches.append((tournament_name, db_name, tournament_club, db_club, tournament_first,
+                                    tournament_last, db_first, db_last, old_club, current_club))
 
     def get_player_history(self, interne_lizenznr: str) -> List[Dict]:
         """Get complete history for a player."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
             cursor.execute("""
-                SELECT * FROM player_history 
-                WHERE interne_lizenznr = ? 
+                SELECT id, interne_lizenznr, first_name, last_name, club, gender, district,
+                       birth_year, age_class, region, qttr, club_number, verband, change_type,
+                       changed_at, previous_club, previous_district
+                FROM player_history
+                WHERE interne_lizenznr = ?
                 ORDER BY changed_at DESC
             """, (interne_lizenznr,))
 
-            columns = [description[0] for description in cursor.description]
-            history = []
-
-            for row in cursor.fetchall():
-                history.append(dict(zip(columns, row)))
-
-            return history
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_all_current_players(self) -> List[PlayerRecord]:
         """Get all current players from database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT * FROM current_players")
-
-            players = []
-            for row in cursor.fetchall():
-                player = PlayerRecord(
-                    interne_lizenznr=row[0],
-                    first_name=row[1],
-                    last_name=row[2],
-                    club=row[3],
-                    gender=row[4],
-                    district=row[5],
-                    birth_year=row[6],
-                    age_class=row[7],
-                    region=row[8],
-                    qttr=row[9],
-                    club_number=row[10],
-                    verband=row[11],
-                    created_at=row[12],
-                    updated_at=row[13]
-                )
-                players.append(player)
-
-            return players
+            # Explicit column list in PlayerRecord field order, so rows unpack positionally
+            cursor.execute(f"SELECT {self._PLAYER_RECORD_COLUMNS} FROM current_players")
+            return [PlayerRecord(*row) for row in cursor.fetchall()]
 
     def get_player_by_lizenznr(self, interne_lizenznr: str) -> Optional[PlayerRecord]:
         """Get a specific player by their internal license number."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT * FROM current_players WHERE interne_lizenznr = ?", (interne_lizenznr,))
+            cursor.execute(f"SELECT {self._PLAYER_RECORD_COLUMNS} FROM current_players WHERE interne_lizenznr = ?",
+                           (interne_lizenznr,))
             row = cursor.fetchone()
 
             if row:
-                return PlayerRecord(
-                    interne_lizenznr=row[0],
-                    first_name=row[1],
-                    last_name=row[2],
-                    club=row[3],
-                    gender=row[4],
-                    district=row[5],
-                    birth_year=row[6],
-                    age_class=row[7],
-                    region=row[8],
-                    qttr=row[9],
-                    club_number=row[10],
-                    verband=row[11],
-                    created_at=row[12],
-                    updated_at=row[13]
-                )
+                return PlayerRecord(*row)
 
             return None
 
     def get_database_stats(self) -> Dict[str, int]:
         """Get database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
             
             cursor.execute("SELECT COUNT(*) FROM current_players")
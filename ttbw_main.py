@@ -2,11 +2,10 @@
 Main application for the TTBW system using the refactored modular structure.
 """
 
+import argparse
 import logging
 import sys
 
-from setuptools.command.setopt import config_file
-
 from database.database_manager import DatabaseManager
 from database.player_manager import PlayerManager
 from database.history_manager import HistoryManager
@@ -94,5 +93,7 @@ def main(config_file: str = "config.yaml") -> None:
 
 
 if __name__ == "__main__":
-    config_file = "config_rem25.yaml"
-    main(config_file)
+    parser = argparse.ArgumentParser(description="Run the TTBW system.")
+    parser.add_argument("--config", default="config_rem25.yaml", help="configuration file (default: %(default)s)")
+    args = parser.parse_args()
+    main(args.config)
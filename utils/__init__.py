@@ -2,7 +2,8 @@
 Utility functions package for TTBW system.
 """
 
+from .edit_distance import bounded_levenshtein
 from .name_utils import NameUtils
 from .text_utils import TextUtils
 
-__all__ = ['NameUtils', 'TextUtils']
+__all__ = ['NameUtils', 'TextUtils', 'bounded_levenshtein']
@@ -0,0 +1,51 @@
+"""
+Bounded edit distance for fuzzy name matching.
+"""
+
+from typing import Optional
+
+
+def bounded_levenshtein(a: str, b: str, tolerance: int) -> Optional[int]:
+    """
+    Levenshtein distance between a and b if it is at most tolerance, None otherwise.
+
+    Uses the bit-parallel algorithm of Myers (1999) in Hyyrö's formulation for
+    edit distance: one bit per character of a, so a whole column of the DP
+    matrix is updated with a few integer operations per character of b.
+    """
+    if abs(len(a) - len(b)) > tolerance:
+        return None
+    if not a or not b:
+        return max(len(a), len(b))
+
+    # Match mask per character of a
+    peq = {}
+    for i, char in enumerate(a):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << len(a)) - 1
+    last_bit = 1 << (len(a) - 1)
+    pv, mv = mask, 0
+    score = len(a)
+    remaining = len(b)
+
+    for char in b:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last_bit:
+            score += 1
+        elif mh & last_bit:
+            score -= 1
+        remaining -= 1
+        # Each remaining character can lower the score by at most one
+        if score - remaining > tolerance:
+            return None
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+
+    return score if score <= tolerance else None
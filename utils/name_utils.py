@@ -2,9 +2,49 @@
 Name utilities for fuzzy matching and name variant generation.
 """
 
+import re
 from typing import List
 
 
+# Common name variations used for fuzzy matching (tried in this order)
+_NAME_VARIANTS = {
+    'marc': ('mark',),
+    'mark': ('marc',),
+    'luis': ('louis',),
+    'louis': ('luis',),
+    'mukherjee': ('mukherjee',),  # Keep as is for now
+    'd´elia': ('d?elia', 'd\'elia', 'delia'),  # Handle encoding variations
+    'd?elia': ('d´elia', 'd\'elia', 'delia'),
+    'd\'elia': ('d´elia', 'd?elia', 'delia'),
+    'delia': ('d´elia', 'd?elia', 'd\'elia'),
+    'löwe': ('löwe', 'loewe'),  # Handle umlaut variations
+    'loewe': ('löwe',),
+    'titus': ('titus',),  # Keep as is for now
+    'kleiss': ('kleiß',),  # Keep as is for now
+    'kleis': ('kleiß',),  # Keep as is for now
+    'kleiß': ('kleiss', 'kleis')  # Keep as is for now
+}
+
+# Encoding variations handled by normalize_encoding
+_ENCODING_MULTI = {
+    'd´elia': 'delia',      # Smart quote to regular apostrophe
+    'd?elia': 'delia',      # Question mark to regular apostrophe
+    'd\'elia': 'delia',     # Regular apostrophe
+    'd´': 'd\'',            # Smart quote to regular apostrophe
+    'd?': 'd\'',            # Question mark to regular apostrophe
+}
+# Longest alternatives first so 'd´elia' wins over 'd´'
+_ENCODING_MULTI_RE = re.compile('|'.join(map(re.escape, sorted(_ENCODING_MULTI, key=len, reverse=True))))
+# Umlaut replacements as a frozen tuple of pairs; chained str.replace is faster than
+# str.translate with a table mapping non-ASCII characters to multi-character strings
+_UMLAUT_PAIRS = (
+    ('ö', 'oe'),            # Umlaut to oe (also covers löwe -> loewe)
+    ('ü', 'ue'),            # Umlaut to ue
+    ('ä', 'ae'),            # Umlaut to ae
+    ('ß', 'ss'),            # Sharp s to ss
+)
+
+
 class NameUtils:
     """Utilities for name processing and fuzzy matching."""
     
@@ -15,30 +55,7 @@ class NameUtils:
             return []
         
         name = name.lower().strip()
-        variants = [name]  # Always include the original name
-        
-        # Common name variations
-        name_variants = {
-            'marc': ['mark'],
-            'mark': ['marc'],
-            'luis': ['louis'],
-            'louis': ['luis'],
-            'mukherjee': ['mukherjee'],  # Keep as is for now
-            'd´elia': ['d?elia', 'd\'elia', 'delia'],  # Handle encoding variations
-            'd?elia': ['d´elia', 'd\'elia', 'delia'],
-            'd\'elia': ['d´elia', 'd?elia', 'delia'],
-            'delia': ['d´elia', 'd?elia', 'd\'elia'],
-            'kleiss': ['kleiss'],  # Keep as is for now
-            'löwe': ['löwe', 'loewe'],  # Handle umlaut variations
-            'loewe': ['löwe'],
-            'titus': ['titus'],  # Keep as is for now
-            'kleiss': ['kleiß'],  # Keep as is for now
-            'kleis': ['kleiß'],  # Keep as is for now
-            'kleiß': ['kleiss', 'kleis']  # Keep as is for now
-        }
-        
-        if name in name_variants:
-            variants.extend(name_variants[name])
+        variants = [name, *_NAME_VARIANTS.get(name, ())]  # Always include the original name
         
         # Add encoding-normalized variants
         normalized_name = NameUtils.normalize_encoding(name)
@@ -50,22 +67,8 @@ class NameUtils:
     @staticmethod
     def normalize_encoding(name: str) -> str:
         """Normalize common encoding variations in names."""
-        # Handle common encoding issues
-        encoding_variants = {
-            'd´elia': 'delia',      # Smart quote to regular apostrophe
-            'd?elia': 'delia',      # Question mark to regular apostrophe
-            'd\'elia': 'delia',     # Regular apostrophe
-            'd´': 'd\'',            # Smart quote to regular apostrophe
-            'd?': 'd\'',            # Question mark to regular apostrophe
-            'löwe': 'loewe',        # Umlaut to oe
-            'ö': 'oe',              # Umlaut to oe
-            'ü': 'ue',              # Umlaut to ue
-            'ä': 'ae',              # Umlaut to ae
-            'ß': 'ss'               # Sharp s to ss
-        }
-        
-        normalized = name
-        for variant, standard in encoding_variants.items():
-            normalized = normalized.replace(variant, standard)
-        
+        # Multi-character quote variants in one regex pass, then the umlauts
+        normalized = _ENCODING_MULTI_RE.sub(lambda m: _ENCODING_MULTI[m.group(0)], name)
+        for umlaut, replacement in _UMLAUT_PAIRS:
+            normalized = normalized.replace(umlaut, replacement)
         return normalized
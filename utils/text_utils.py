@@ -2,50 +2,76 @@
 Text processing utilities for the TTBW system.
 """
 
+import functools
 import re
+import sys
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-class TextUtils:
-    """Utilities for text processing and normalization."""
+
+def replace_umlauts(text: str) -> str:
+    """Replace German umlauts with their ASCII equivalents."""
+    # Chained str.replace beats str.translate here: a table mapping non-ASCII characters
+    # to multi-character strings takes translate's slow per-character path.
+    # Most frequent in German names first, the rare capitals last.
+    return (text.replace('ü', 'ue').replace('ä', 'ae').replace('ö', 'oe').replace('ß', 'ss')
+            .replace('Ü', 'Ue').replace('Ä', 'Ae').replace('Ö', 'Oe'))
+
+
+# Lowercase umlauts, all that is left to replace after casefold() (which turns ß into ss)
+_LOWER_UMLAUT_PAIRS = (('ü', 'ue'), ('ä', 'ae'), ('ö', 'oe'))
+
+
+def _replace_umlauts_lower(text: str) -> str:
+    """Replace lowercase umlauts only; for text that has already been case-folded (ß -> ss)."""
+    for umlaut, replacement in _LOWER_UMLAUT_PAIRS:
+        text = text.replace(umlaut, replacement)
+    return text
+
+
+@functools.lru_cache(maxsize=8192)
+def normalize_name(name: str) -> str:
+    """Normalize a name for consistent comparison."""
+    # Strip first so casefold() copies only the name itself; casefold (which also turns
+    # ß into ss) never produces or removes whitespace, so the order doesn't matter.
+    # '' falls through to '' on its own; only None (or another non-string) lands here
+    try:
+        normalized = name.strip().casefold()
+    except AttributeError:
+        return ""
     
-    @staticmethod
-    def replace_umlauts(text: str) -> str:
-        """Replace German umlauts with their ASCII equivalents."""
-        umlaut_map = {
-            'ä': 'ae', 'ö': 'oe', 'ü': 'ue',
-            'Ä': 'Ae', 'Ö': 'Oe', 'Ü': 'Ue',
-            'ß': 'ss'
-        }
-        
-        for umlaut, replacement in umlaut_map.items():
-            text = text.replace(umlaut, replacement)
-        
-        return text
+    # Pure ASCII strings contain no umlauts
+    if not normalized.isascii():
+        # Replace umlauts (no capitals left after casefold())
+        normalized = _replace_umlauts_lower(normalized)
     
-    @staticmethod
-    def normalize_name(name: str) -> str:
-        """Normalize a name for consistent comparison."""
-        if not name:
-            return ""
-        
-        # Convert to lowercase and strip whitespace
-        normalized = name.lower().strip()
-        
-        # Replace umlauts
-        normalized = TextUtils.replace_umlauts(normalized)
-        
-        return normalized
+    # Interned, so inputs that normalize alike share one string object as dict keys
+    return sys.intern(normalized)
+
+
+def normalize_name_series(names: "pd.Series") -> "pd.Series":
+    """Normalize a whole column of names (or clubs) at once, same rules as normalize_name."""
+    # Like normalize_name, anything that is not a string (None, NaN, numbers) becomes ''
+    is_text = names.map(lambda value: isinstance(value, str)).astype(bool)
+    normalized = names.where(is_text, '').astype(str).str.strip().str.casefold()
+    for umlaut, replacement in _LOWER_UMLAUT_PAIRS:
+        normalized = normalized.str.replace(umlaut, replacement, regex=False)
+    return normalized
+
+
+def normalize_club(club: str) -> str:
+    """Normalize a club name for consistent comparison."""
+    # Same rules as names; sharing the implementation also shares its cache
+    return normalize_name(club)
+
+
+class TextUtils:
+    """Utilities for text processing and normalization."""
     
-    @staticmethod
-    def normalize_club(club: str) -> str:
-        """Normalize a club name for consistent comparison."""
-        if not club:
-            return ""
-        
-        # Convert to lowercase and strip whitespace
-        normalized = club.lower().strip()
-        
-        # Replace umlauts
-        normalized = TextUtils.replace_umlauts(normalized)
-        
-        return normalized
+    # Kept for existing callers; new code can import the module-level functions directly
+    replace_umlauts = staticmethod(replace_umlauts)
+    normalize_name = staticmethod(normalize_name)
+    normalize_name_series = staticmethod(normalize_name_series)
+    normalize_club = staticmethod(normalize_club)